@@ -13,11 +13,10 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path)
 from src.agents.event_agent import EventAgent
-from src.agents.jira_agent import JiraAgent
 from src.agents.code_review_agent import CodeReviewAgent
 from src.agents.testing_agent import TestingAgent
 from src.middleware.webhook_middleware import verify_jira_webhook_signature
-from src.scheduler import get_scheduler
+from src.scheduler import AgentScheduler, get_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +30,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     scheduler.stop()
+    await scheduler.aclose()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -80,15 +80,12 @@ async def _process_jira_task_in_background(issue_key: str):
     """Background task to process Jira issue with AI agent."""
     print(f"\n🚀 [BACKGROUND] Starting task processing for {issue_key}")
     try:
-        agent = JiraAgent(
-            jira_url=os.getenv("JIRA_URL"),
-            jira_username=os.getenv("JIRA_USERNAME"),
-            jira_token=os.getenv("JIRA_API_TOKEN"),
-            ai_management_url=os.getenv("AI_MANAGEMENT_URL"),
-            git_repo_path=os.getenv("GIT_REPO_PATH", "/tmp/repo"),
-        )
-        result = await agent.process_task(issue_key)
-        print(f"✅ [BACKGROUND] Jira task {issue_key} processed successfully:\n{result}")
+        # Deduped and capped with the scheduler's own runs; agent errors
+        # are logged by the scheduler
+        if await get_scheduler().run_now("develop", issue_key):
+            print(f"✅ [BACKGROUND] Jira task {issue_key} processed")
+        else:
+            print(f"⏭️  [BACKGROUND] Jira task {issue_key} in progress or processed recently; skipped")
     except Exception as e:
         print(f"❌ [BACKGROUND] Error processing Jira task {issue_key}: {e}")
         import traceback
@@ -96,10 +93,11 @@ async def _process_jira_task_in_background(issue_key: str):
 
 
 @app.post("/webhooks/jira")
-async def jira_webhook(request: JiraWebhookRequest, background_tasks: BackgroundTasks):
+async def jira_webhook(request: JiraWebhookRequest):
     """
     Receive Jira webhook events.
-    Filters for 'Development Waiting' status and dispatches to JiraAgent.
+    Queues issues in a handled status (Waiting Development, In Review,
+    Testing) on the scheduler, which dispatches them to the matching agent.
     """
     print(f"🔔 Jira webhook received: {request.webhookEvent}")
     
@@ -108,22 +106,20 @@ async def jira_webhook(request: JiraWebhookRequest, background_tasks: Background
     issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "")
     status = issue.get("fields", {}).get("status", {}).get("name", "")
     
-    # Only process if in "Waiting Development" status
-    if status == "Waiting Development":
-        print(f"  Task ready: {issue_key} ({issue_type})")
-        # Dispatch to background task
-        background_tasks.add_task(_process_jira_task_in_background, issue_key)
+    kind = get_scheduler().enqueue(issue_key, status) if issue_key else None
+    if kind:
+        print(f"  Task ready: {issue_key} ({issue_type}) -> {kind}")
         return {
             "status": "accepted",
             "issue_key": issue_key,
-            "message": "Task dispatched to background processing"
+            "message": f"Task queued for {kind} processing"
         }
     else:
         return {
             "status": "skipped",
             "issue_key": issue_key,
             "status_current": status,
-            "message": "Only 'Development Waiting' status is processed"
+            "message": "Only 'Waiting Development', 'In Review' and 'Testing' statuses are processed"
         }
 
 
@@ -262,35 +258,21 @@ async def api_process_development(background_tasks: BackgroundTasks):
         - count: number of tasks found
     """
     try:
-        from src.clients.jira_client import JiraClient
-        
-        jira_client = JiraClient(
-            jira_url=os.getenv("JIRA_URL"),
-            username=os.getenv("JIRA_USERNAME"),
-            api_token=os.getenv("JIRA_API_TOKEN"),
-        )
+        jira_client = await get_scheduler().get_jira_client()
         
         # Find all Waiting Development tasks
-        jql = 'status = "Waiting Development" AND assignee is EMPTY'
-        issues = await jira_client.search_issues(jql)
+        issue_keys = await jira_client.search_issue_keys(AgentScheduler.JQL_WAITING_DEVELOPMENT)
         
-        if not issues:
+        if not issue_keys:
             return {
                 "status": "no_tasks",
                 "count": 0,
                 "message": "No 'Development Waiting' tasks found"
             }
         
-        # Dispatch each issue to background processing (key or id)
-        issue_keys = []
-        for issue in issues:
-            if isinstance(issue, dict):
-                issue_key = issue.get('key') or issue.get('id') or str(issue)
-            else:
-                issue_key = str(issue)
-            if issue_key:
-                issue_keys.append(issue_key)
-                background_tasks.add_task(_process_jira_task_in_background, issue_key)
+        # Dispatch each issue to background processing
+        for issue_key in issue_keys:
+            background_tasks.add_task(_process_jira_task_in_background, issue_key)
         
         return {
             "status": "started",
@@ -317,19 +299,12 @@ async def api_process_reviews(background_tasks: BackgroundTasks):
         - count: number of tasks found
     """
     try:
-        from src.clients.jira_client import JiraClient
-        
-        jira_client = JiraClient(
-            jira_url=os.getenv("JIRA_URL"),
-            username=os.getenv("JIRA_USERNAME"),
-            api_token=os.getenv("JIRA_API_TOKEN"),
-        )
+        jira_client = await get_scheduler().get_jira_client()
         
         # Find all review-ready tasks
-        jql = 'status in ("Code Review", "In Review")'
-        issues = await jira_client.search_issues(jql)
+        issue_keys = await jira_client.search_issue_keys(AgentScheduler.JQL_IN_REVIEW)
         
-        if not issues:
+        if not issue_keys:
             return {
                 "status": "no_tasks",
                 "count": 0,
@@ -337,15 +312,14 @@ async def api_process_reviews(background_tasks: BackgroundTasks):
             }
         
         # Dispatch each issue to background processing
-        for issue in issues:
-            issue_key = issue.get('key')
+        for issue_key in issue_keys:
             background_tasks.add_task(_review_code_in_background, issue_key, [])
         
         return {
             "status": "started",
-            "count": len(issues),
-            "message": f"Started reviewing {len(issues)} task(s)",
-            "issues": [issue.get('key') for issue in issues]
+            "count": len(issue_keys),
+            "message": f"Started reviewing {len(issue_keys)} task(s)",
+            "issues": issue_keys
         }
     
     except Exception as e:
@@ -366,19 +340,12 @@ async def api_process_testing(background_tasks: BackgroundTasks):
         - count: number of tasks found
     """
     try:
-        from src.clients.jira_client import JiraClient
-        
-        jira_client = JiraClient(
-            jira_url=os.getenv("JIRA_URL"),
-            username=os.getenv("JIRA_USERNAME"),
-            api_token=os.getenv("JIRA_API_TOKEN"),
-        )
+        jira_client = await get_scheduler().get_jira_client()
         
         # Find all Testing tasks
-        jql = 'status = "Testing"'
-        issues = await jira_client.search_issues(jql)
+        issue_keys = await jira_client.search_issue_keys(AgentScheduler.JQL_TESTING)
         
-        if not issues:
+        if not issue_keys:
             return {
                 "status": "no_tasks",
                 "count": 0,
@@ -386,15 +353,14 @@ async def api_process_testing(background_tasks: BackgroundTasks):
             }
         
         # Dispatch each issue to background processing
-        for issue in issues:
-            issue_key = issue.get('key')
+        for issue_key in issue_keys:
             background_tasks.add_task(_run_tests_in_background, issue_key, None)
         
         return {
             "status": "started",
-            "count": len(issues),
-            "message": f"Started testing {len(issues)} task(s)",
-            "issues": [issue.get('key') for issue in issues]
+            "count": len(issue_keys),
+            "message": f"Started testing {len(issue_keys)} task(s)",
+            "issues": issue_keys
         }
     
     except Exception as e:
@@ -415,45 +381,29 @@ async def api_process_all(background_tasks: BackgroundTasks):
         - tasks: breakdown by stage
     """
     try:
-        from src.clients.jira_client import JiraClient
-        
-        jira_client = JiraClient(
-            jira_url=os.getenv("JIRA_URL"),
-            username=os.getenv("JIRA_USERNAME"),
-            api_token=os.getenv("JIRA_API_TOKEN"),
-        )
-        
-        results = {
-            "development_waiting": [],
-            "in_review": [],
-            "testing": []
-        }
+        jira_client = await get_scheduler().get_jira_client()
         
         # Process Waiting Development
-        dev_jql = 'status = "Waiting Development" AND assignee is EMPTY'
-        dev_issues = await jira_client.search_issues(dev_jql)
-        for issue in dev_issues:
-            issue_key = issue.get('key')
-            results["development_waiting"].append(issue_key)
+        dev_keys = await jira_client.search_issue_keys(AgentScheduler.JQL_WAITING_DEVELOPMENT)
+        for issue_key in dev_keys:
             background_tasks.add_task(_process_jira_task_in_background, issue_key)
         
         # Process review-ready
-        review_jql = 'status in ("Code Review", "In Review")'
-        review_issues = await jira_client.search_issues(review_jql)
-        for issue in review_issues:
-            issue_key = issue.get('key')
-            results["in_review"].append(issue_key)
+        review_keys = await jira_client.search_issue_keys(AgentScheduler.JQL_IN_REVIEW)
+        for issue_key in review_keys:
             background_tasks.add_task(_review_code_in_background, issue_key, [])
         
         # Process Testing
-        test_jql = 'status = "Testing"'
-        test_issues = await jira_client.search_issues(test_jql)
-        for issue in test_issues:
-            issue_key = issue.get('key')
-            results["testing"].append(issue_key)
+        test_keys = await jira_client.search_issue_keys(AgentScheduler.JQL_TESTING)
+        for issue_key in test_keys:
             background_tasks.add_task(_run_tests_in_background, issue_key, None)
         
-        total = len(dev_issues) + len(review_issues) + len(test_issues)
+        results = {
+            "development_waiting": dev_keys,
+            "in_review": review_keys,
+            "testing": test_keys
+        }
+        total = len(dev_keys) + len(review_keys) + len(test_keys)
         
         return {
             "status": "started",
@@ -0,0 +1,19 @@
+"""Shared base class for structured agent outputs."""
+
+from typing import Optional
+
+
+class AgentOutputBase:
+    """Base for agent results evaluated by the orchestrator.
+    
+    Subclasses (dataclasses) must define `success` and `error` fields, which
+    lets the orchestrator read them directly instead of probing with
+    hasattr/getattr. Only annotations live here: a class-level default would
+    be picked up as the dataclass default and break field ordering.
+    
+    Attributes:
+        success: Whether the agent completed successfully
+        error: Error message if success is False
+    """
+    success: bool
+    error: Optional[str]
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+from .base import AgentOutputBase
+
 
 class ReviewDecision(str, Enum):
     """Code review decision levels."""
@@ -33,7 +35,7 @@ class ReviewIssue:
 
 
 @dataclass
-class CodeReviewResult:
+class CodeReviewResult(AgentOutputBase):
     """Structured result from code review."""
     success: bool
     decision: ReviewDecision
@@ -14,6 +14,8 @@ Output: Structured result with files to create/update and commit message
 from dataclasses import dataclass, field
 from typing import Dict, Any, List
 
+from .base import AgentOutputBase
+
 
 @dataclass
 class FileChange:
@@ -28,7 +30,7 @@ class FileChange:
 
 
 @dataclass
-class DevelopmentResult:
+class DevelopmentResult(AgentOutputBase):
     """Structured output from development agent.
     
     This output is consumed by GitService (in orchestrator layer) to perform
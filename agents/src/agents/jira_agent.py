@@ -1,17 +1,34 @@
+import asyncio
 import os
 import json
+import re
 import subprocess
 import tempfile
+import time
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from src.knowledge.context_loader import build_ai_prompt
 from src.clients.jira_client import JiraClient
 from src.clients.ai_management_client import AIManagementClient
 
+REVIEW_TRANSITIONS = ("Code Review", "In Review", "Review")
+
+# Summary scanners for generated code, compiled once
+_ENDPOINT_DECORATORS = ("@app.get", "@app.post", "@router.get", "@router.post")
+_ENDPOINT_PATH_RE = re.compile(r'["\'](/[^"\']*)["\']')
+_DEFINITION_RE = re.compile(r"^[ \t]*(?:(?:async )?def|class)\s+(\w+)", re.MULTILINE)
+
 
 class JiraAgent:
     """Agent that processes Jira tasks: code gen → test gen → PR creation."""
     
+    # Seconds a workflow state's transition list is reused
+    TRANSITIONS_TTL = 300.0
+    
+    # Repo path -> lock serializing checkout → add → commit → push; shared
+    # by every agent so concurrent tasks never commit onto another's branch
+    _repo_locks: Dict[str, asyncio.Lock] = {}
+    
     def __init__(
         self,
         jira_url: str,
@@ -21,13 +38,19 @@ class JiraAgent:
         git_repo_path: str = None,
         git_user_name: str = "AI Agent",
         git_user_email: str = "agent@ai.local",
+        jira_client: Optional[JiraClient] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
-        self.jira_client = JiraClient(jira_url, jira_username, jira_token)
+        self.jira_client = jira_client or JiraClient(
+            jira_url, jira_username, jira_token, http_client=http_client
+        )
         self.ai_management_url = ai_management_url or os.getenv("AI_MANAGEMENT_URL")
-        self.ai_client = AIManagementClient(self.ai_management_url)
+        self.ai_client = AIManagementClient(self.ai_management_url, client=http_client)
         self.git_repo_path = git_repo_path or os.getenv("GIT_REPO_PATH") or os.getcwd()
         self.git_user_name = git_user_name
         self.git_user_email = git_user_email
+        # (project, issue type, status) -> (fetched at, transition name -> id)
+        self._transitions_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, str]]] = {}
     
     async def process_task(self, issue_key: str) -> Dict[str, Any]:
         """Main orchestration: fetch task → generate code → gen tests → create PR."""
@@ -81,17 +104,21 @@ class JiraAgent:
         )
         
         # Step 6: Update Jira task status (only if we actually produced a PR in a git repo)
+        success_comment = None
         can_post_success = self._is_git_repo() and pr_info.get("html_url") not in (None, "N/A")
         if can_post_success:
-            await self.jira_client.add_comment(
-                issue_key,
-                f"✅ AI Agent completed development:\n- Code generated and tested\n- PR created: {pr_info.get('html_url', 'N/A')}\n- Ready for code review"
-            )
+            success_comment = f"✅ AI Agent completed development:\n- Code generated and tested\n- PR created: {pr_info.get('html_url', 'N/A')}\n- Ready for code review"
         else:
             print("  ⚠️ Success comment skipped: missing git repo or PR info")
         
-        # Move issue to Code Review (fallback to In Review if not available)
-        await self._transition_to_status(issue_key, target_names=["Code Review", "In Review", "Review"])        
+        # Move issue to Code Review (fallback to In Review if not available),
+        # posting the success comment in the same request
+        await self._transition_to_status(
+            issue_key,
+            target_names=REVIEW_TRANSITIONS,
+            workflow_key=self._workflow_key(issue_key, issue),
+            comment=success_comment,
+        )
         
         return {
             "issue_key": issue_key,
@@ -102,25 +129,93 @@ class JiraAgent:
             "pr": pr_info,
         }
 
-    async def _transition_to_status(self, issue_key: str, target_names: list) -> None:
-        """Transition Jira issue to one of the desired statuses by name."""
+    async def _transition_to_status(
+        self,
+        issue_key: str,
+        target_names: tuple,
+        workflow_key: Optional[Tuple[str, str, str]] = None,
+        comment: Optional[str] = None,
+    ) -> None:
+        """Transition Jira issue to the first desired status available by name.
+        
+        With a workflow_key, the transition list is reused for issues in the
+        same workflow state for TRANSITIONS_TTL seconds. A cached entry that
+        has no match or whose id Jira rejects is dropped and looked up live.
+        
+        A comment is sent with the transition in one request; if no transition
+        happens it is posted on its own.
+        """
         try:
-            transitions = await self.jira_client.get_transitions(issue_key)
-            target = None
-            for name in target_names:
-                for t in transitions:
-                    if t.get("name") == name:
-                        target = t
-                        break
-                if target:
-                    break
-            if not target:
-                print(f"  ⚠️ No matching transition found for {target_names}; skipping status change")
+            if await self._transition_cached_or_live(issue_key, target_names, workflow_key, comment):
                 return
-            await self.jira_client.transition_issue(issue_key, transition_id=target.get("id"))
-            print(f"  🔄 Transitioned '{issue_key}' to '{target.get('name')}'")
+            print(f"  ⚠️ No matching transition found for {target_names}; skipping status change")
         except Exception as e:
             print(f"  ⚠️ Transition error for {issue_key}: {e}")
+        
+        if comment:
+            await self.jira_client.add_comment(issue_key, comment)
+    
+    async def _transition_cached_or_live(
+        self,
+        issue_key: str,
+        target_names: tuple,
+        workflow_key: Optional[Tuple[str, str, str]],
+        comment: Optional[str],
+    ) -> bool:
+        """Try the cached transition map, then a live one; True once transitioned."""
+        by_name = self._cached_transitions(workflow_key)
+        if by_name is not None:
+            try:
+                if await self._apply_transition(issue_key, by_name, target_names, comment):
+                    return True
+            except httpx.HTTPStatusError:
+                pass
+            self._transitions_cache.pop(workflow_key, None)
+        
+        transitions = await self.jira_client.get_transitions(issue_key)
+        by_name = {t.get("name"): t.get("id") for t in transitions}
+        if workflow_key is not None:
+            self._transitions_cache[workflow_key] = (time.monotonic(), by_name)
+        return await self._apply_transition(issue_key, by_name, target_names, comment)
+    
+    async def _apply_transition(
+        self,
+        issue_key: str,
+        by_name: Dict[str, str],
+        target_names: tuple,
+        comment: Optional[str] = None,
+    ) -> bool:
+        """Perform the first available target transition; False if none match."""
+        for name in target_names:
+            transition_id = by_name.get(name)
+            if transition_id:
+                await self.jira_client.transition_issue(
+                    issue_key, transition_id=transition_id, comment=comment
+                )
+                print(f"  🔄 Transitioned '{issue_key}' to '{name}'")
+                return True
+        return False
+    
+    def _cached_transitions(
+        self, workflow_key: Optional[Tuple[str, str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """Return the cached transition map for a workflow state, if still fresh."""
+        if workflow_key is None:
+            return None
+        cached = self._transitions_cache.get(workflow_key)
+        if cached is None or time.monotonic() - cached[0] >= self.TRANSITIONS_TTL:
+            return None
+        return cached[1]
+    
+    @staticmethod
+    def _workflow_key(issue_key: str, issue: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Key transitions by project, issue type and current status."""
+        fields = issue.get("fields") or {}
+        return (
+            issue_key.split("-", 1)[0],
+            (fields.get("issuetype") or {}).get("name", ""),
+            (fields.get("status") or {}).get("name", ""),
+        )
     
     async def generate_code(
         self, task_title: str, task_description: str, labels: list
@@ -128,8 +223,9 @@ class JiraAgent:
         """Use AI to generate code for the task."""
         print(f"  📝 Generating code...")
         
-        # Build context with existing codebase
-        prompt = build_ai_prompt(task_title, task_description, labels)
+        # Build context with existing codebase (runs git log and walks the
+        # source tree, so keep it off the event loop)
+        prompt = await asyncio.to_thread(build_ai_prompt, task_title, task_description, labels)
         
         # Add code generation instructions
         code_prompt = (
@@ -197,64 +293,74 @@ class JiraAgent:
         """Commit code and tests to git, push to remote."""
         print(f"  🔧 Committing and pushing...")
         
-        # Create branch
-        # If repo is not a git repository, skip git operations
-        is_git_repo = self._is_git_repo()
-        if is_git_repo:
-            subprocess.run(
-                ["git", "checkout", "-b", branch_name],
-                cwd=self.git_repo_path,
-                check=True,
-            )
-        
-        # Write code file
-        code_path = os.path.join(self.git_repo_path, f"agents/src/agents/{issue_key}_impl.py")
-        os.makedirs(os.path.dirname(code_path), exist_ok=True)
-        with open(code_path, "w") as f:
-            f.write(code)
-        
-        # Write test file
-        test_path = os.path.join(self.git_repo_path, f"tests/test_{issue_key}.py")
-        os.makedirs(os.path.dirname(test_path), exist_ok=True)
-        with open(test_path, "w") as f:
-            f.write(tests)
-        
-        commit_sha = "unknown"
-        if is_git_repo:
-            # Configure git
-            subprocess.run(
-                ["git", "config", "user.name", self.git_user_name],
-                cwd=self.git_repo_path,
-            )
-            subprocess.run(
-                ["git", "config", "user.email", self.git_user_email],
-                cwd=self.git_repo_path,
-            )
+        # The steps await one another, so hold the repo lock across the
+        # whole sequence
+        async with self._repo_lock():
+            # Create branch
+            # If repo is not a git repository, skip git operations
+            is_git_repo = self._is_git_repo()
+            if is_git_repo:
+                await self._git("checkout", "-b", branch_name, check=True)
             
-            # Add and commit
-            subprocess.run(
-                ["git", "add", code_path, test_path],
-                cwd=self.git_repo_path,
-                check=True,
-            )
-            result = subprocess.run(
-                ["git", "commit", "-m", f"[{issue_key}] {task_title}"],
-                cwd=self.git_repo_path,
-                capture_output=True,
-                text=True,
-            )
+            # Write code file
+            code_path = os.path.join(self.git_repo_path, f"agents/src/agents/{issue_key}_impl.py")
+            os.makedirs(os.path.dirname(code_path), exist_ok=True)
+            with open(code_path, "w") as f:
+                f.write(code)
             
-            commit_sha = result.stdout.split("(")[0].strip() if result.returncode == 0 else "unknown"
+            # Write test file
+            test_path = os.path.join(self.git_repo_path, f"tests/test_{issue_key}.py")
+            os.makedirs(os.path.dirname(test_path), exist_ok=True)
+            with open(test_path, "w") as f:
+                f.write(tests)
             
-            # Push to remote
-            subprocess.run(
-                ["git", "push", "-u", "origin", branch_name],
-                cwd=self.git_repo_path,
-            )
-        else:
-            print("  ⚠️ No git repo detected; files written without commit/push")
+            commit_sha = "unknown"
+            if is_git_repo:
+                # Add and commit (identity passed per command, no `git config` runs)
+                await self._git("add", code_path, test_path, check=True)
+                returncode, stdout = await self._git(
+                    "-c", f"user.name={self.git_user_name}",
+                    "-c", f"user.email={self.git_user_email}",
+                    "commit", "-m", f"[{issue_key}] {task_title}",
+                )
+                
+                commit_sha = stdout.split("(")[0].strip() if returncode == 0 else "unknown"
+                
+                # Push to remote
+                await self._git("push", "-u", "origin", branch_name)
+            else:
+                print("  ⚠️ No git repo detected; files written without commit/push")
+            
+            return commit_sha
+    
+    def _repo_lock(self) -> asyncio.Lock:
+        """Return the lock shared by all agents working in git_repo_path."""
+        path = os.path.realpath(self.git_repo_path)
+        return self._repo_locks.setdefault(path, asyncio.Lock())
+    
+    async def _git(self, *args: str, check: bool = False) -> Tuple[int, str]:
+        """Run a git command in the repo without blocking the event loop.
         
-        return commit_sha
+        Args:
+            *args: Arguments passed to git
+            check: Raise if git exits non-zero
+            
+        Returns:
+            Tuple of (return code, decoded stdout)
+            
+        Raises:
+            subprocess.CalledProcessError: If check is set and git fails
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=self.git_repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, ["git", *args], stdout, stderr)
+        return proc.returncode, stdout.decode("utf-8", errors="replace")
     
     async def create_pull_request(
         self,
@@ -392,33 +498,23 @@ class JiraAgent:
     def _extract_endpoints(self, code: str) -> list:
         """Extract API endpoints from code."""
         endpoints = []
-        lines = code.split("\n")
-        for line in lines:
-            if "@app.get" in line or "@app.post" in line or "@router.get" in line or "@router.post" in line:
-                # Try to extract path
-                if '"/' in line or "'/" in line:
-                    import re
-                    match = re.search(r'["\'](/[^"\']*)["\']', line)
-                    if match:
-                        endpoints.append(match.group(1))
-        return endpoints[:5]
+        for line in code.splitlines():
+            if any(decorator in line for decorator in _ENDPOINT_DECORATORS):
+                match = _ENDPOINT_PATH_RE.search(line)
+                if match:
+                    endpoints.append(match.group(1))
+                    if len(endpoints) == 5:
+                        break
+        return endpoints
     
     def _extract_functions(self, code: str) -> list:
         """Extract function/class definitions from code."""
         functions = []
-        lines = code.split("\n")
-        for line in lines:
-            if line.strip().startswith("def ") or line.strip().startswith("async def "):
-                import re
-                match = re.search(r'(?:async )?def\s+(\w+)', line)
-                if match:
-                    functions.append(match.group(1))
-            elif line.strip().startswith("class "):
-                import re
-                match = re.search(r'class\s+(\w+)', line)
-                if match:
-                    functions.append(match.group(1))
-        return functions[:5]
+        for match in _DEFINITION_RE.finditer(code):
+            functions.append(match.group(1))
+            if len(functions) == 5:
+                break
+        return functions
 
     def _is_git_repo(self) -> bool:
         """Check if the configured path is a git repository."""
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
+from .base import AgentOutputBase
+
 
 class TestStatus(str, Enum):
     """Test execution status."""
@@ -31,7 +33,7 @@ class TestFailure:
 
 
 @dataclass
-class TestResult:
+class TestResult(AgentOutputBase):
     """Structured result from test execution."""
     success: bool
     status: TestStatus
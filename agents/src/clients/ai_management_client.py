@@ -13,21 +13,26 @@ class AIManagementClient:
     def __init__(
         self,
         base_url: str = "http://localhost:8001",
-        timeout: float = 60.0
+        timeout: float = 60.0,
+        client: Optional[httpx.AsyncClient] = None
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.client = None
+        # An injected client is shared with other callers and never closed here
+        self.client = client
+        self._owns_client = client is None
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        if not self.client:
+            self.client = httpx.AsyncClient(timeout=self.timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.client:
+        if self.client and self._owns_client:
             await self.client.aclose()
+            self.client = None
     
     async def health_check(self) -> bool:
         """Check service health"""
@@ -35,7 +40,7 @@ class AIManagementClient:
             if not self.client:
                 self.client = httpx.AsyncClient(timeout=self.timeout)
             
-            response = await self.client.get(f"{self.base_url}/health")
+            response = await self.client.get(f"{self.base_url}/health", timeout=self.timeout)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Health check failed: {e}")
@@ -67,7 +72,8 @@ class AIManagementClient:
                 self.client = httpx.AsyncClient(timeout=self.timeout)
             response = await self.client.post(
                 f"{self.base_url}/generate",
-                json=payload
+                json=payload,
+                timeout=self.timeout
             )
             response.raise_for_status()
             return response.json()
@@ -78,7 +84,7 @@ class AIManagementClient:
     async def list_providers(self) -> Dict[str, Any]:
         """List available LLM providers"""
         try:
-            response = await self.client.get(f"{self.base_url}/providers")
+            response = await self.client.get(f"{self.base_url}/providers", timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except Exception as e:
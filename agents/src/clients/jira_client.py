@@ -1,18 +1,33 @@
+import asyncio
 import base64
 import httpx
 import json
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Union
 
 
 class JiraClient:
     """Async Jira HTTP client for issue management."""
     
-    def __init__(self, jira_url: str, username: str, api_token: str, timeout: int = 30):
+    # Default field projection for search_issues
+    SEARCH_FIELDS = "key,status,summary,description,issuetype,labels"
+    
+    def __init__(
+        self,
+        jira_url: str,
+        username: str,
+        api_token: str,
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self.jira_url = jira_url.rstrip("/")
         self.username = username
         self.api_token = api_token
         self.timeout = timeout
         self._auth_header = self._build_auth_header()
+        # Caller-owned client shared with other services; used as-is, never closed
+        self._shared_http = http_client
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def _build_auth_header(self) -> Dict[str, str]:
         """Build Basic Auth header for Jira API."""
@@ -20,6 +35,29 @@ class JiraClient:
         encoded = base64.b64encode(creds.encode()).decode()
         return {"Authorization": f"Basic {encoded}"}
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client for the running event loop.
+        
+        Reusing one client keeps connections alive across calls instead of
+        paying a TCP/TLS handshake per request. httpx clients are bound to
+        the loop they were first used on, so a new one is created if the
+        caller is on a different loop.
+        """
+        if self._shared_http is not None:
+            return self._shared_http
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.is_closed or self._http_loop is not loop:
+            self._http = httpx.AsyncClient(timeout=self.timeout)
+            self._http_loop = loop
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if this client opened one."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
+    
     async def get_issue(self, issue_key: str, fields: Optional[str] = None) -> Dict[str, Any]:
         """Fetch a single Jira issue by key."""
         url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
@@ -27,36 +65,55 @@ class JiraClient:
         if fields:
             params["fields"] = fields
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(
-                url,
-                params=params,
-                headers=self._auth_header,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = self._get_http_client()
+        resp = await client.get(
+            url,
+            params=params,
+            headers=self._auth_header,
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
     
-    async def search_issues(self, jql: str, max_results: int = 50) -> List[Dict[str, Any]]:
+    async def search_issues(
+        self,
+        jql: str,
+        max_results: int = 50,
+        fields: Union[str, Sequence[str]] = SEARCH_FIELDS,
+    ) -> List[Dict[str, Any]]:
         """Search issues using JQL and return list of issues.
 
         Jira /search/jql endpoint requires explicit fields parameter to include key.
+        Pass a narrower ``fields`` projection (e.g. ``"key"`` or ``["key", "status"]``)
+        when only some fields are needed to shrink the response payload.
         """
         url = f"{self.jira_url}/rest/api/3/search/jql"
         params = {
             "jql": jql,
             "maxResults": max_results,
-            "fields": "key,status,summary,description,issuetype,labels",
+            "fields": fields if isinstance(fields, str) else ",".join(fields),
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(
-                url,
-                params=params,
-                headers=self._auth_header,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("issues", [])
+        client = self._get_http_client()
+        resp = await client.get(
+            url,
+            params=params,
+            headers=self._auth_header,
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("issues", [])
+    
+    async def search_issue_keys(self, jql: str, max_results: int = 500) -> List[str]:
+        """Search issues using JQL and return only their keys.
+
+        Requests the minimal ``key`` projection and drops entries without one.
+        Key-only pages are small, so the default page is larger than
+        search_issues' to avoid extra round-trips on big backlogs.
+        """
+        issues = await self.search_issues(jql, max_results=max_results, fields="key")
+        return [issue["key"] for issue in issues if "key" in issue]
     
     async def get_issue_by_status(self, status: str, project_key: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch issues by status."""
@@ -89,14 +146,15 @@ class JiraClient:
             }
         }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(
-                url,
-                json=payload,
-                headers={**self._auth_header, "Content-Type": "application/json"},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        client = self._get_http_client()
+        resp = await client.post(
+            url,
+            json=payload,
+            headers={**self._auth_header, "Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
     
     async def transition_issue(self, issue_key: str, transition_id: str, comment: Optional[str] = None) -> None:
         """Transition issue to a new status."""
@@ -131,23 +189,25 @@ class JiraClient:
                 ]
             }
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(
-                url,
-                json=payload,
-                headers={**self._auth_header, "Content-Type": "application/json"},
-            )
-            resp.raise_for_status()
+        client = self._get_http_client()
+        resp = await client.post(
+            url,
+            json=payload,
+            headers={**self._auth_header, "Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
     
     async def get_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
         """Get available transitions for an issue."""
         url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/transitions"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(
-                url,
-                headers=self._auth_header,
-            )
-            resp.raise_for_status()
-            result = resp.json()
-            return result.get("transitions", [])
+        client = self._get_http_client()
+        resp = await client.get(
+            url,
+            headers=self._auth_header,
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        return result.get("transitions", [])
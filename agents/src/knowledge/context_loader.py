@@ -6,6 +6,10 @@ from typing import Dict, Optional, List
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DOCS_DIR = os.path.join(BASE_DIR, "agents", "docs")
 
+# Left out of the code structure listing sent to the LLM
+_SKIP_DIRS = frozenset({"__pycache__", ".git", ".pytest_cache", ".venv", "venv", "node_modules"})
+_SKIP_EXTS = frozenset({".pyc", ".pyo", ".so", ".dll", ".png", ".jpg", ".jpeg", ".gif", ".zip"})
+
 
 def _read(path: str) -> str:
     try:
@@ -46,9 +50,13 @@ def scan_code_structure(paths: Optional[List[str]] = None) -> str:
     for t in targets:
         try:
             for root, dirs, files in os.walk(t):
+                # Prune in place so os.walk never descends into skipped dirs
+                dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
                 rel = os.path.relpath(root, BASE_DIR)
                 lines.append(f"- {rel}/")
                 for fn in sorted(files):
+                    if os.path.splitext(fn)[1].lower() in _SKIP_EXTS:
+                        continue
                     lines.append(f"  - {os.path.join(rel, fn)}")
         except Exception:
             continue
@@ -31,7 +31,7 @@ async def verify_jira_webhook_signature(request: Request, call_next: Callable):
     
     # Verify signature
     if not WebhookSecurity.verify_signature(
-        body.decode() if body else "",
+        body,
         signature or "",
         secret
     ):
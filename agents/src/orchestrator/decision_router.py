@@ -3,8 +3,8 @@
 Pure routing logic—no agent invocation, no LLMs.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Set
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 
 class MissingContextError(Exception):
@@ -17,7 +17,7 @@ class UnknownIntentError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
     """Represents a single agent task in an execution plan.
     
@@ -31,7 +31,7 @@ class AgentTask:
     params: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionPlan:
     """Ordered sequence of agents to execute.
     
@@ -39,15 +39,21 @@ class ExecutionPlan:
         intent_type: The intent that generated this plan
         tasks: List of AgentTask objects in execution order
         parallelizable: List of sets, each set containing agent indices that can run in parallel
+        agents: Agent names in task order (derived from tasks once)
+        summary: Agent names joined with " → " (derived from tasks once)
     """
     intent_type: str
     tasks: List[AgentTask]
     parallelizable: List[Set[int]] = None
+    agents: Tuple[str, ...] = field(init=False, repr=False)
+    summary: str = field(init=False, repr=False)
     
     def __post_init__(self):
-        """Set default empty parallelizable list."""
+        """Set default empty parallelizable list and derive agent names."""
         if self.parallelizable is None:
             self.parallelizable = []
+        self.agents = tuple(task.agent for task in self.tasks)
+        self.summary = " → ".join(self.agents)
 
 
 # Decision rules: intent type -> ExecutionPlan template
@@ -222,3 +228,14 @@ def get_intent_requirements(intent_type: str) -> List[str]:
         raise UnknownIntentError(f"Unknown intent type: '{intent_type}'")
     
     return CONTEXT_REQUIREMENTS.get(intent_type, [])
+
+
+def list_intent_requirements() -> Dict[str, List[str]]:
+    """Return required context fields for every registered intent type.
+    
+    Bulk form of get_intent_requirements(), sorted by intent type.
+    """
+    return {
+        intent_type: CONTEXT_REQUIREMENTS.get(intent_type, [])
+        for intent_type in sorted(DECISION_RULES)
+    }
@@ -13,6 +13,8 @@ from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+import heapq
 import json
 
 
@@ -32,7 +34,7 @@ class PipelineStatus(str, Enum):
     FAILED = "FAILED"    # Failed before any agent execution
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerInfo:
     """Information about what triggered the pipeline."""
     source: str  # e.g., "jira_webhook", "manual", "scheduled"
@@ -47,7 +49,7 @@ class TriggerInfo:
             self.timestamp = datetime.utcnow().isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionStep:
     """A single step in the pipeline execution."""
     step_number: int
@@ -66,7 +68,7 @@ class ExecutionStep:
             self.started_at = datetime.utcnow().isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionTrace:
     """Complete trace of a pipeline execution.
     
@@ -268,12 +270,8 @@ class TraceStore:
         Returns:
             List of recent traces, most recent first
         """
-        traces = sorted(
-            self._traces.values(),
-            key=lambda t: t.started_at,
-            reverse=True,
-        )
-        return traces[:limit]
+        # Partial selection: O(n log limit) instead of sorting every trace
+        return heapq.nlargest(limit, self._traces.values(), key=attrgetter("started_at"))
     
     def clear(self) -> None:
         """Clear all stored traces."""
@@ -12,6 +12,8 @@ Agents must NOT run git operations directly.
 
 import os
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -51,6 +53,20 @@ class GitService:
     All git commands are executed via subprocess (not shell injection).
     """
     
+    # Candidate base refs for new branches, in order of preference
+    BASE_REF_CANDIDATES = (
+        "refs/remotes/origin/main",
+        "refs/remotes/origin/master",
+        "refs/heads/main",
+        "refs/heads/master",
+    )
+    
+    # Seconds a resolved base ref is reused before probing git again
+    BASE_REF_TTL = 60.0
+    
+    # Max threads used to write files in parallel
+    MAX_WRITE_WORKERS = 8
+    
     def __init__(self, repo_root: str):
         """Initialize GitService with a repository root.
         
@@ -61,6 +77,8 @@ class GitService:
             ValueError: If repo_root is not a valid git repository
         """
         self.repo_root = repo_root
+        self._base_ref: Optional[str] = None
+        self._base_ref_resolved_at = 0.0
         self._validate_repo()
     
     def _validate_repo(self) -> None:
@@ -150,7 +168,6 @@ class GitService:
             Branch name like "feature/DEMO-42" or "feature/auto-<timestamp>"
         """
         # Try to extract Jira key from first file path or use timestamp
-        import time
         timestamp = str(int(time.time()))
         return f"feature/auto-{timestamp}"
     
@@ -172,39 +189,58 @@ class GitService:
                 capture_output=True,
             )
             
-            # Create and checkout branch from main or master
-            for base_branch in ["main", "master"]:
-                try:
-                    subprocess.run(
-                        ["git", "checkout", "-b", branch_name, f"origin/{base_branch}"],
-                        cwd=self.repo_root,
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                    )
-                    return
-                except subprocess.CalledProcessError:
-                    continue
-            
-            # If we get here, try from local branches
-            for base_branch in ["main", "master"]:
-                try:
-                    subprocess.run(
-                        ["git", "checkout", "-b", branch_name, base_branch],
-                        cwd=self.repo_root,
-                        check=True,
-                        capture_output=True,
-                    )
-                    return
-                except subprocess.CalledProcessError:
-                    continue
+            # Create and checkout branch from origin main/master, else local
+            base_ref = self._resolve_base_ref()
+            if base_ref is None:
+                raise RuntimeError(
+                    f"Could not create branch {branch_name}: no valid base branch found"
+                )
             
-            raise RuntimeError(
-                f"Could not create branch {branch_name}: no valid base branch found"
-            )
+            try:
+                subprocess.run(
+                    ["git", "checkout", "-b", branch_name, base_ref],
+                    cwd=self.repo_root,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+            except subprocess.CalledProcessError as e:
+                # The cached ref may be stale; probe again next time
+                self._base_ref = None
+                raise RuntimeError(e.stderr or e.stdout)
         except Exception as e:
             raise RuntimeError(f"Failed to create branch {branch_name}: {str(e)}")
     
+    def _resolve_base_ref(self) -> Optional[str]:
+        """Find the ref new branches start from.
+        
+        Lists all candidate refs with a single `git for-each-ref` call and
+        caches the result for BASE_REF_TTL seconds.
+        
+        Returns:
+            Short ref name (e.g. "origin/main"), or None if none exists
+        """
+        now = time.monotonic()
+        if self._base_ref is not None and now - self._base_ref_resolved_at < self.BASE_REF_TTL:
+            return self._base_ref
+        
+        result = subprocess.run(
+            ["git", "for-each-ref", "--format=%(refname)", *self.BASE_REF_CANDIDATES],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+        )
+        existing = set(result.stdout.split())
+        
+        self._base_ref = None
+        for ref in self.BASE_REF_CANDIDATES:
+            if ref in existing:
+                # refs/remotes/origin/main -> origin/main, refs/heads/main -> main
+                self._base_ref = ref.split("/", 2)[2]
+                self._base_ref_resolved_at = now
+                break
+        return self._base_ref
+    
     def _write_files(self, files: List[dict]) -> List[str]:
         """Write files to disk.
         
@@ -217,8 +253,8 @@ class GitService:
         Raises:
             IOError: If file write fails
         """
-        files_written = []
-        
+        # Validate every path before touching the disk
+        targets = []
         for file_dict in files:
             file_path = file_dict.get("path")
             content = file_dict.get("content")
@@ -238,19 +274,35 @@ class GitService:
                     f"File path escapes repository root: {file_path}"
                 )
             
-            # Create parent directories
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            
-            # Write file
-            try:
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-            except IOError as e:
-                raise IOError(f"Failed to write {file_path}: {str(e)}")
+            targets.append((file_path, full_path, content))
+        
+        if len(targets) <= 1:
+            return [self._write_file(*target) for target in targets]
+        
+        # Overlap disk I/O for larger change sets; map() keeps input order
+        # and re-raises the first failure
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WRITE_WORKERS, len(targets))) as pool:
+            return list(pool.map(lambda target: self._write_file(*target), targets))
+    
+    @staticmethod
+    def _write_file(file_path: str, full_path: str, content: str) -> str:
+        """Write one validated file, creating parent directories.
+        
+        Returns:
+            The repo-relative file path
             
-            files_written.append(file_path)
+        Raises:
+            IOError: If file write fails
+        """
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        
+        try:
+            with open(full_path, "w", encoding="utf-8") as f:
+                f.write(content)
+        except IOError as e:
+            raise IOError(f"Failed to write {file_path}: {str(e)}")
         
-        return files_written
+        return file_path
     
     def _stage_and_commit(self, files: List[str], message: str) -> str:
         """Stage files and create a commit.
@@ -1,13 +1,23 @@
 """Intent data model and types.
 
 Intents represent user-facing requests that agents need to fulfill.
+This is the single definition of Intent; orchestrator.py and router.py
+both import it from here.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 from enum import Enum
 
 
+class IntentContextError(TypeError, ValueError):
+    """Raised when an Intent's context is not a dictionary.
+    
+    Subclasses both TypeError (what intent.Intent raised) and ValueError
+    (what orchestrator.Intent raised) so existing handlers keep working.
+    """
+
+
 class IntentType(str, Enum):
     """Standard intent types."""
     
@@ -18,23 +28,31 @@ class IntentType(str, Enum):
     RUN_TESTS = "run_tests"
 
 
-@dataclass
+@dataclass(slots=True)
 class Intent:
-    """Represents a high-level request to be fulfilled by agents.
+    """User-facing request that agents need to fulfill.
     
     Attributes:
-        type: The intent type (e.g., REGISTER_EVENT)
-        context: Domain-specific parameters needed to fulfill the intent
+        type: Intent type (e.g., "register_event" or IntentType.REGISTER_EVENT)
+        context: Domain-specific parameters (dict)
         metadata: Optional metadata (user_id, timestamp, priority, etc.)
-    """
     
-    type: IntentType
+    Raises:
+        ValueError: If type is not a non-empty string.
+        IntentContextError: If context is not a dict.
+    
+    An empty context is accepted: required fields are checked per intent
+    by the orchestrator's validation step, so intents such as run_tests
+    can be created with ``context={}``. The intent.Intent that rejected
+    empty contexts had no callers relying on that check.
+    """
+    type: str
     context: Dict[str, Any]
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = None
     
     def __post_init__(self):
         """Validate intent structure."""
-        if not self.context:
-            raise ValueError("Intent context cannot be empty")
+        if not isinstance(self.type, str) or not self.type:
+            raise ValueError("Intent type must be a non-empty string")
         if not isinstance(self.context, dict):
-            raise TypeError("Intent context must be a dictionary")
+            raise IntentContextError("Intent context must be a dictionary")
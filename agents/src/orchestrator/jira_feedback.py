@@ -166,19 +166,16 @@ class JiraFeedbackService:
         if not target_status:
             return
         
-        # Find matching transition
-        transition_id = None
-        for transition in transitions:
-            if transition.get("name", "").lower() == target_status.lower():
-                transition_id = transition.get("id")
-                break
+        # Index transitions by lowercased name once
+        by_name = {
+            transition.get("name", "").lower(): transition.get("id")
+            for transition in transitions
+        }
+        transition_id = by_name.get(target_status.lower())
         
         # If "Blocked" not found and we wanted it, try "In Review"
         if not transition_id and target_status == "Blocked":
-            for transition in transitions:
-                if transition.get("name", "").lower() == "in review":
-                    transition_id = transition.get("id")
-                    break
+            transition_id = by_name.get("in review")
         
         # Perform transition if found
         if transition_id:
@@ -11,15 +11,25 @@ Key principles:
 - Fully explainable decisions
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+import itertools
 import json
+import os
+import threading
+import uuid
 
 from orchestrator.execution_trace import ExecutionTrace, StepStatus, PipelineStatus
 
 
+# Process-local proposal ID source (proposals are only kept in memory)
+_proposal_counter = itertools.count()
+_proposal_pid = os.getpid()
+
+
 class PatternType(str, Enum):
     """Type of detected pattern."""
     REPEATED_CODE_REVIEW_FAILURE = "REPEATED_CODE_REVIEW_FAILURE"
@@ -89,7 +99,10 @@ class LearningProposal:
             self.created_at = datetime.utcnow().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+        """Convert to dictionary for serialization.
+        
+        Enum fields are returned as their plain string values.
+        """
         return {
             "proposal_id": self.proposal_id,
             "pattern_type": self.pattern_type.value,
@@ -115,11 +128,23 @@ class PatternDetector:
     
     Uses deterministic rules to identify repeated failures
     and common error patterns.
+    
+    Patterns are kept in LRU order and capped at max_patterns so a
+    long-running process does not grow without bound.
     """
     
-    def __init__(self):
-        """Initialize pattern detector."""
-        self._patterns: Dict[str, Pattern] = {}
+    MAX_PATTERNS = 10_000
+    
+    def __init__(self, max_patterns: Optional[int] = None):
+        """Initialize pattern detector.
+        
+        Args:
+            max_patterns: Maximum patterns to keep (defaults to MAX_PATTERNS)
+        """
+        self.max_patterns = max_patterns or self.MAX_PATTERNS
+        self._patterns: "OrderedDict[str, Pattern]" = OrderedDict()
+        # Guards _patterns so traces can be analyzed from several threads
+        self._lock = threading.RLock()
     
     def analyze_trace(self, trace: ExecutionTrace) -> List[Pattern]:
         """Analyze a single trace for patterns.
@@ -166,25 +191,30 @@ class PatternDetector:
         pattern_key = f"{step.agent_name}::{error_sig}"
         
         # Update or create pattern
-        if pattern_key in self._patterns:
-            # Existing pattern - increment
-            pattern = self._patterns[pattern_key]
-            pattern.occurrences += 1
-            pattern.last_seen = datetime.utcnow().isoformat()
-            if trace.trace_id not in pattern.trace_ids:
-                pattern.trace_ids.append(trace.trace_id)
-        else:
-            # New pattern
-            pattern = Pattern(
-                pattern_type=pattern_type,
-                agent_name=step.agent_name,
-                error_signature=error_sig,
-                occurrences=1,
-                first_seen=datetime.utcnow().isoformat(),
-                last_seen=datetime.utcnow().isoformat(),
-                trace_ids=[trace.trace_id],
-            )
-            self._patterns[pattern_key] = pattern
+        with self._lock:
+            pattern = self._patterns.get(pattern_key)
+            if pattern is not None:
+                # Existing pattern - increment
+                pattern.occurrences += 1
+                pattern.last_seen = datetime.utcnow().isoformat()
+                if trace.trace_id not in pattern.trace_ids:
+                    pattern.trace_ids.append(trace.trace_id)
+                self._patterns.move_to_end(pattern_key)
+            else:
+                # New pattern
+                pattern = Pattern(
+                    pattern_type=pattern_type,
+                    agent_name=step.agent_name,
+                    error_signature=error_sig,
+                    occurrences=1,
+                    first_seen=datetime.utcnow().isoformat(),
+                    last_seen=datetime.utcnow().isoformat(),
+                    trace_ids=[trace.trace_id],
+                )
+                self._patterns[pattern_key] = pattern
+                if len(self._patterns) > self.max_patterns:
+                    # Evict least recently seen pattern
+                    self._patterns.popitem(last=False)
         
         return pattern
     
@@ -232,7 +262,8 @@ class PatternDetector:
         Returns:
             List of all patterns
         """
-        return list(self._patterns.values())
+        with self._lock:
+            return list(self._patterns.values())
     
     def get_pattern_by_key(self, key: str) -> Optional[Pattern]:
         """Get a specific pattern by key.
@@ -247,7 +278,8 @@ class PatternDetector:
     
     def clear(self) -> None:
         """Clear all patterns."""
-        self._patterns.clear()
+        with self._lock:
+            self._patterns.clear()
 
 
 class LearningGate:
@@ -266,6 +298,10 @@ class LearningGate:
     RECENCY_WEIGHT = 0.3
     SEVERITY_WEIGHT = 0.2
     
+    # Use random UUIDs instead of process-local counter IDs
+    # (enable when proposals are persisted across processes)
+    USE_UUID_PROPOSAL_IDS = False
+    
     def __init__(self):
         """Initialize learning gate."""
         pass
@@ -343,8 +379,6 @@ class LearningGate:
         Returns:
             LearningProposal with all metadata
         """
-        import uuid
-        
         # Evaluate pattern
         decision, rejection_reason = self.evaluate(pattern)
         
@@ -359,7 +393,7 @@ class LearningGate:
         
         # Create proposal
         proposal = LearningProposal(
-            proposal_id=str(uuid.uuid4()),
+            proposal_id=self._next_proposal_id(),
             pattern_type=pattern.pattern_type,
             source_agent=pattern.agent_name,
             observed_pattern=self._describe_pattern(pattern),
@@ -375,6 +409,16 @@ class LearningGate:
         
         return proposal
     
+    def _next_proposal_id(self) -> str:
+        """Generate a unique proposal ID.
+        
+        Returns:
+            "<pid>-<hex counter>", or a UUID hex if USE_UUID_PROPOSAL_IDS is set
+        """
+        if self.USE_UUID_PROPOSAL_IDS:
+            return uuid.uuid4().hex
+        return f"{_proposal_pid}-{next(_proposal_counter):x}"
+    
     def _suggest_domain(self, pattern: Pattern) -> KnowledgeDomain:
         """Suggest which knowledge domain this pattern belongs to.
         
@@ -431,11 +475,24 @@ class ProposalStore:
     - Database
     - File system
     - Review queue system
+    
+    The in-memory store keeps at most max_proposals entries. When full,
+    the oldest rejected proposal is dropped first, then the oldest overall.
     """
     
-    def __init__(self):
-        """Initialize proposal store."""
-        self._proposals: Dict[str, LearningProposal] = {}
+    MAX_PROPOSALS = 1_000
+    
+    def __init__(self, max_proposals: Optional[int] = None):
+        """Initialize proposal store.
+        
+        Args:
+            max_proposals: Maximum proposals to keep (defaults to MAX_PROPOSALS)
+        """
+        self.max_proposals = max_proposals or self.MAX_PROPOSALS
+        self._proposals: "OrderedDict[str, LearningProposal]" = OrderedDict()
+        # Parsed created_at timestamps, filled lazily by compact()
+        self._created: Dict[str, datetime] = {}
+        self._lock = threading.RLock()
     
     def store(self, proposal: LearningProposal) -> None:
         """Store a proposal.
@@ -443,7 +500,44 @@ class ProposalStore:
         Args:
             proposal: The proposal to store
         """
-        self._proposals[proposal.proposal_id] = proposal
+        with self._lock:
+            self._proposals[proposal.proposal_id] = proposal
+            self._created.pop(proposal.proposal_id, None)
+            if len(self._proposals) > self.max_proposals:
+                self._evict_one()
+    
+    def _evict_one(self) -> None:
+        """Drop the oldest rejected proposal, or the oldest proposal if none."""
+        victim = next(
+            (pid for pid, p in self._proposals.items() if p.gate_decision == GateDecision.REJECT),
+            next(iter(self._proposals)),
+        )
+        del self._proposals[victim]
+        self._created.pop(victim, None)
+    
+    def compact(self, window_seconds: float) -> int:
+        """Drop proposals created more than window_seconds ago.
+        
+        Args:
+            window_seconds: Age limit in seconds
+            
+        Returns:
+            Number of proposals removed
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=window_seconds)
+        with self._lock:
+            expired = []
+            for pid, proposal in self._proposals.items():
+                created = self._created.get(pid)
+                if created is None:
+                    created = datetime.fromisoformat(proposal.created_at)
+                    self._created[pid] = created
+                if created < cutoff:
+                    expired.append(pid)
+            for pid in expired:
+                del self._proposals[pid]
+                del self._created[pid]
+            return len(expired)
     
     def get(self, proposal_id: str) -> Optional[LearningProposal]:
         """Get a proposal by ID.
@@ -462,7 +556,8 @@ class ProposalStore:
         Returns:
             List of all proposals
         """
-        return list(self._proposals.values())
+        with self._lock:
+            return list(self._proposals.values())
     
     def get_approved(self) -> List[LearningProposal]:
         """Get all approved proposals (PROPOSE decision).
@@ -470,7 +565,8 @@ class ProposalStore:
         Returns:
             List of approved proposals
         """
-        return [p for p in self._proposals.values() if p.gate_decision == GateDecision.PROPOSE]
+        with self._lock:
+            return [p for p in self._proposals.values() if p.gate_decision == GateDecision.PROPOSE]
     
     def get_rejected(self) -> List[LearningProposal]:
         """Get all rejected proposals.
@@ -478,11 +574,14 @@ class ProposalStore:
         Returns:
             List of rejected proposals
         """
-        return [p for p in self._proposals.values() if p.gate_decision == GateDecision.REJECT]
+        with self._lock:
+            return [p for p in self._proposals.values() if p.gate_decision == GateDecision.REJECT]
     
     def clear(self) -> None:
         """Clear all proposals."""
-        self._proposals.clear()
+        with self._lock:
+            self._proposals.clear()
+            self._created.clear()
 
 
 # Global instances
@@ -1,23 +1,34 @@
 """Orchestrator: Single entry point for agent orchestration.
 
-Accepts an intent, applies decision rules, executes agents sequentially.
+Accepts an intent, applies decision rules, executes agents in plan order
+(running parallelizable groups concurrently).
 Controls the entire development pipeline.
 
 Includes execution tracing for observability and debugging.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Callable, Dict, Any, Generator, List, NamedTuple, Optional, Tuple, Union
+import asyncio
+import concurrent.futures
+import importlib
+import inspect
+import logging
+import operator
+import threading
 import uuid
 import os
 from orchestrator.decision_router import (
     apply_rules,
+    DECISION_RULES,
     ExecutionPlan,
     UnknownIntentError,
     MissingContextError,
-    list_available_intents,
-    get_intent_requirements,
+    list_intent_requirements,
 )
+from orchestrator.git_service import create_git_service
+from orchestrator.intent import Intent
 from orchestrator.execution_trace import (
     ExecutionTrace,
     TriggerInfo,
@@ -25,30 +36,107 @@ from orchestrator.execution_trace import (
     PipelineStatus,
     get_trace_store,
 )
+from agents.base import AgentOutputBase
+from agents.code_review_agent import ReviewDecision
+from agents.testing_agent import TestStatus
 
+logger = logging.getLogger(__name__)
+# Library module: stay silent unless the application configures logging
+logger.addHandler(logging.NullHandler())
 
-@dataclass
-class Intent:
-    """User-facing request that agents need to fulfill.
+
+def _agent_factory(module_name: str, class_name: str) -> Callable[[], Any]:
+    """Build a factory that imports an agent module on first use."""
+    agent_class = None
     
-    Attributes:
-        type: Intent type (e.g., "register_event", "create_campaign")
-        context: Domain-specific parameters (dict)
-        metadata: Optional metadata (user_id, timestamp, priority, etc.)
-    """
-    type: str
-    context: Dict[str, Any]
-    metadata: Dict[str, Any] = None
+    def factory() -> Any:
+        nonlocal agent_class
+        if agent_class is None:
+            # Resolve the class once; later calls skip the import machinery
+            agent_class = getattr(importlib.import_module(module_name), class_name)
+        return agent_class()
+    return factory
+
+
+# Agent name -> zero-argument constructor (agent modules load lazily)
+_AGENT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "development_agent": _agent_factory("agents.development_agent", "DevelopmentAgent"),
+    "code_review_agent": _agent_factory("agents.code_review_agent", "CodeReviewAgent"),
+    "testing_agent": _agent_factory("agents.testing_agent", "TestingAgent"),
+}
+
+
+# FileChange -> (path, content) in a single C-level call
+_path_and_content = operator.attrgetter("path", "content")
+
+
+# Enum members are singletons, so checkers compare them with `is`
+_BLOCK = ReviewDecision.BLOCK
+_REQUEST_CHANGES = ReviewDecision.REQUEST_CHANGES
+_TEST_FAIL = TestStatus.FAIL
+
+
+# Shared stand-in for absent Intent.metadata (read-only, never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+
+# Accepted spellings for boolean environment flags
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+# Intent metadata never changes at runtime, so build it once at import
+_available_intents: Dict[str, List[str]] = list_intent_requirements()
+
+
+# (should_continue, error_message, step_status to record when stopping)
+_CheckResult = tuple[bool, Optional[str], Optional[StepStatus]]
+_CONTINUE: _CheckResult = (True, None, None)
+
+
+def _check_code_review(output: Any) -> Optional[_CheckResult]:
+    """Stop on BLOCK / REQUEST_CHANGES; APPROVE falls through."""
+    decision = getattr(output, 'decision', None)
+    if decision is _BLOCK:
+        return False, f"Code review BLOCKED: {output.reasoning}", StepStatus.BLOCKED
+    if decision is _REQUEST_CHANGES:
+        return False, f"Code review REQUEST_CHANGES: {output.reasoning}", StepStatus.FAIL
+    return None
+
+
+def _check_testing(output: Any) -> Optional[_CheckResult]:
+    """Stop on FAIL; PASS falls through."""
+    if getattr(output, 'status', None) is _TEST_FAIL:
+        return (
+            False,
+            f"Tests FAILED: {output.summary} ({output.failed_count} failures)",
+            StepStatus.FAIL,
+        )
+    return None
+
+
+def _check_success(output: Any) -> _CheckResult:
+    """Generic check for every agent: stop when output.success is False."""
+    if isinstance(output, AgentOutputBase):
+        # Typed agent results always carry success / error
+        if not output.success:
+            return False, f"Agent failed: {output.error}", StepStatus.FAIL
+    elif not getattr(output, 'success', True):
+        error = getattr(output, 'error', 'Unknown error')
+        return False, f"Agent failed: {error}", StepStatus.FAIL
     
-    def __post_init__(self):
-        """Validate intent structure."""
-        if not isinstance(self.type, str) or not self.type:
-            raise ValueError("Intent type must be a non-empty string")
-        if not isinstance(self.context, dict):
-            raise ValueError("Intent context must be a dictionary")
+    # All checks passed - continue pipeline
+    return _CONTINUE
 
 
-@dataclass
+# Agent-specific status checks, run BEFORE the generic success check.
+# A checker returns a _CheckResult, or None to fall through.
+_RESULT_CHECKERS: Dict[str, Callable[[Any], Optional[_CheckResult]]] = {
+    "code_review_agent": _check_code_review,
+    "testing_agent": _check_testing,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class OrchestrationDecision:
     """Result of routing an intent through the orchestrator.
     
@@ -66,26 +154,32 @@ class OrchestrationDecision:
     parallelizable_groups: List[set]
     status: str = "success"
     error: str = None
+    _repr: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __repr__(self):
-        """Human-readable representation."""
-        if self.status == "error":
-            return f"OrchestrationDecision(status=error, error={self.error})"
+        """Human-readable representation (built once, then reused by logging)."""
+        if self._repr is not None:
+            return self._repr
         
-        agents_str = " → ".join(self.agents)
-        return (
-            f"OrchestrationDecision(\n"
-            f"  intent={self.intent_type},\n"
-            f"  agents={agents_str},\n"
-            f"  parallelizable_groups={self.parallelizable_groups}\n"
-            f")"
-        )
+        if self.status == "error":
+            text = f"OrchestrationDecision(status=error, error={self.error})"
+        else:
+            text = (
+                f"OrchestrationDecision(\n"
+                f"  intent={self.intent_type},\n"
+                f"  agents={self.execution_plan.summary},\n"
+                f"  parallelizable_groups={self.parallelizable_groups}\n"
+                f")"
+            )
+        object.__setattr__(self, "_repr", text)
+        return text
 
 
-@dataclass
-class AgentExecutionResult:
+class AgentExecutionResult(NamedTuple):
     """Result of executing a single agent.
     
+    A NamedTuple: built once per task, never mutated, cheap to construct.
+    
     Attributes:
         agent: Agent name
         success: Whether agent executed successfully
@@ -95,10 +189,10 @@ class AgentExecutionResult:
     agent: str
     success: bool
     output: Any = None
-    error: str = None
+    error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     """Result of executing the entire pipeline.
     
@@ -109,6 +203,7 @@ class PipelineResult:
         final_commit: Git commit hash if development was successful
         error: Error message if status is "failure"
         trace_id: ID of the execution trace for this run
+        agents_executed: Number of successful agents (derived)
     """
     intent_type: str
     status: str  # "success", "partial", "failure"
@@ -116,17 +211,21 @@ class PipelineResult:
     final_commit: Optional[str] = None
     error: Optional[str] = None
     trace_id: Optional[str] = None
+    agents_executed: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Count successful agents once instead of on every repr."""
+        object.__setattr__(
+            self, "agents_executed", sum(1 for r in self.agent_results if r.success)
+        )
     
     def __repr__(self):
         """Human-readable representation."""
-        agents_executed = len([r for r in self.agent_results if r.success])
-        total_agents = len(self.agent_results)
-        
         return (
             f"PipelineResult(\n"
             f"  intent={self.intent_type},\n"
             f"  status={self.status},\n"
-            f"  agents_executed={agents_executed}/{total_agents},\n"
+            f"  agents_executed={self.agents_executed}/{len(self.agent_results)},\n"
             f"  final_commit={self.final_commit or 'N/A'},\n"
             f"  trace_id={self.trace_id or 'N/A'}\n"
             f")"
@@ -140,7 +239,7 @@ class Orchestrator:
     - Accept an intent
     - Validate the intent
     - Apply decision rules (via decision_router)
-    - Execute agents sequentially
+    - Execute agents in plan order (parallelizable groups concurrently)
     - Detect and handle ALL agent failures centrally
     - Return complete pipeline result
     
@@ -156,9 +255,57 @@ class Orchestrator:
     - Stops on first failure
     """
     
+    # Maximum number of cached routing decisions
+    PLAN_CACHE_SIZE = 256
+    
+    # Maximum number of idle instances kept per agent; extras are dropped
+    MAX_PER_AGENT = 4
+    
     def __init__(self):
         """Initialize orchestrator with agent registry."""
         self._agent_instances = {}
+        # Idle agent instances per name. Agents are not reentrant, so tasks
+        # running concurrently each check out their own instance.
+        self._idle_agents: Dict[str, List[Any]] = {}
+        self._agent_pool_lock = threading.Lock()
+        # Routing decisions keyed by (intent type, context keys). Plans only
+        # depend on which keys are present, never on their values.
+        self._plan_cache: "OrderedDict[tuple, OrchestrationDecision]" = OrderedDict()
+        self._plan_cache_lock = threading.Lock()
+        self._plan_cache_hits = 0
+        self._plan_cache_misses = 0
+        # GitService per repository root; creating one runs `git rev-parse`
+        self._git_services: Dict[str, Any] = {}
+        
+        # Opt-in: import and build agents up front (CLI / cold-start setups)
+        if os.getenv("ORCHESTRATOR_EAGER_WARMUP", "").lower() in _TRUTHY:
+            self.warmup()
+    
+    def warmup(self, agents: Optional[List[str]] = None) -> threading.Thread:
+        """Import and instantiate agents in a background thread.
+        
+        Moves agent module import cost off the first request. Enabled
+        automatically when ORCHESTRATOR_EAGER_WARMUP=1.
+        
+        Args:
+            agents: Agent names to warm up (defaults to all known agents)
+            
+        Returns:
+            The started daemon thread (join it to wait for warmup)
+        """
+        names = list(agents) if agents is not None else list(_AGENT_FACTORIES)
+        
+        def run() -> None:
+            for name in names:
+                try:
+                    self._get_agent(name)
+                except Exception as e:
+                    # Warmup is best effort; the real call will surface errors
+                    logger.warning("Warmup failed for %s: %s", name, e)
+        
+        thread = threading.Thread(target=run, name="orchestrator-warmup", daemon=True)
+        thread.start()
+        return thread
     
     def _get_agent(self, agent_name: str) -> Any:
         """Get or create an agent instance.
@@ -172,24 +319,17 @@ class Orchestrator:
         Raises:
             ValueError: If agent type is not supported
         """
-        if agent_name in self._agent_instances:
-            return self._agent_instances[agent_name]
-        
-        # Lazy-load agents by type
-        if agent_name == "development_agent":
-            from agents.development_agent import DevelopmentAgent
-            agent = DevelopmentAgent()
-        elif agent_name == "code_review_agent":
-            from agents.code_review_agent import CodeReviewAgent
-            agent = CodeReviewAgent()
-        elif agent_name == "testing_agent":
-            from agents.testing_agent import TestingAgent
-            agent = TestingAgent()
-        else:
-            raise ValueError(f"Unknown agent type: {agent_name}")
+        agent = self._agent_instances.get(agent_name)
+        if agent is not None:
+            return agent
+        
+        try:
+            factory = _AGENT_FACTORIES[agent_name]
+        except KeyError:
+            raise ValueError(f"Unknown agent type: {agent_name}") from None
         
-        self._agent_instances[agent_name] = agent
-        return agent
+        # setdefault keeps the first instance if two threads race here
+        return self._agent_instances.setdefault(agent_name, factory())
     
     def _execute_git_operations(
         self,
@@ -212,15 +352,11 @@ class Orchestrator:
             Commit hash if successful, None if failed
         """
         try:
-            from orchestrator.git_service import create_git_service
-            
             # Convert FileChange objects to dicts for GitService
-            files_list = []
-            for file_change in dev_output.files:
-                files_list.append({
-                    "path": file_change.path,
-                    "content": file_change.content,
-                })
+            files_list = [
+                {"path": path, "content": content}
+                for path, content in map(_path_and_content, dev_output.files)
+            ]
             
             # Get repository root (from context or use current directory)
             repo_root = intent_context.get("repo_root") or os.getcwd()
@@ -229,11 +365,15 @@ class Orchestrator:
             jira_key = intent_context.get("jira_issue_key", "AUTO")
             branch_name = intent_context.get("branch_name") or f"develop/{jira_key.lower()}"
             
-            # Create GitService
-            git_service = create_git_service(repo_root)
+            # Reuse the GitService for this repository (validated once)
+            git_service = self._git_services.get(repo_root)
+            if git_service is None:
+                git_service = self._git_services.setdefault(
+                    repo_root, create_git_service(repo_root)
+                )
             
             # Execute git operations
-            print(f"  🔧 Running git operations in {repo_root}")
+            logger.info("🔧 Running git operations in %s", repo_root)
             git_result = git_service.execute_operation(
                 files=files_list,
                 commit_message=dev_output.commit_message,
@@ -243,7 +383,7 @@ class Orchestrator:
             # Check result
             if not git_result.success:
                 error_msg = f"Git operations failed: {git_result.error}"
-                print(f"  ✗ {error_msg}")
+                logger.error("✗ %s", error_msg)
                 
                 # Update trace with error
                 trace.update_step(
@@ -269,7 +409,7 @@ class Orchestrator:
             
         except Exception as e:
             error_msg = f"Git operations exception: {str(e)}"
-            print(f"  ✗ {error_msg}")
+            logger.error("✗ %s", error_msg)
             
             # Update trace
             trace.update_step(
@@ -282,7 +422,7 @@ class Orchestrator:
             
             return None
     
-    def _check_agent_result(self, agent_name: str, output: Any) -> tuple[bool, Optional[str]]:
+    def _check_agent_result(self, agent_name: str, output: Any) -> _CheckResult:
         """Centralized agent result checking.
         
         This is the SINGLE place where agent results are evaluated for continuation.
@@ -297,35 +437,20 @@ class Orchestrator:
             output: The agent's output object
             
         Returns:
-            Tuple of (should_continue, error_message)
-            - (True, None) means continue pipeline
-            - (False, "reason") means stop pipeline
+            Tuple of (should_continue, error_message, step_status)
+            - (True, None, None) means continue pipeline
+            - (False, "reason", status) means stop pipeline; status is BLOCKED
+              for a code review BLOCK and FAIL for other stops
         """
-        # Check 1: CodeReviewAgent decision field (checked BEFORE generic success)
-        if agent_name == "code_review_agent" and hasattr(output, 'decision'):
-            from agents.code_review_agent import ReviewDecision
-            
-            if output.decision == ReviewDecision.BLOCK:
-                return False, f"Code review BLOCKED: {output.reasoning}"
-            elif output.decision == ReviewDecision.REQUEST_CHANGES:
-                return False, f"Code review REQUEST_CHANGES: {output.reasoning}"
-            # APPROVE means continue
-        
-        # Check 2: TestingAgent status field (checked BEFORE generic success)
-        if agent_name == "testing_agent" and hasattr(output, 'status'):
-            from agents.testing_agent import TestStatus
-            
-            if output.status == TestStatus.FAIL:
-                return False, f"Tests FAILED: {output.summary} ({output.failed_count} failures)"
-            # PASS means continue
+        # Check 1: Agent-specific status fields (checked BEFORE generic success)
+        checker = _RESULT_CHECKERS.get(agent_name)
+        if checker is not None:
+            result = checker(output)
+            if result is not None:
+                return result
         
-        # Check 3: Generic success field (fallback for agents without specific status)
-        if hasattr(output, 'success') and not output.success:
-            error = getattr(output, 'error', 'Unknown error')
-            return False, f"Agent failed: {error}"
-        
-        # All checks passed - continue pipeline
-        return True, None
+        # Check 2: Generic success field (fallback for agents without specific status)
+        return _check_success(output)
     
     def route(self, intent: Intent) -> OrchestrationDecision:
         """Route an intent to an execution plan (planning phase).
@@ -337,48 +462,301 @@ class Orchestrator:
             OrchestrationDecision with the execution plan or error
         """
         
+        # Exact type check first; isinstance only for Intent subclasses
+        if type(intent) is not Intent and not isinstance(intent, Intent):
+            return self._error_decision("unknown", "Input must be an Intent object")
+        
         try:
-            # Validate intent
-            if not isinstance(intent, Intent):
-                raise ValueError("Input must be an Intent object")
-            
-            # Apply routing rules
-            plan = apply_rules(intent.type, intent.context)
-            
-            # Extract agent names
-            agents = [task.agent for task in plan.tasks]
-            
-            # Build decision
-            decision = OrchestrationDecision(
-                intent_type=intent.type,
-                agents=agents,
-                execution_plan=plan,
-                parallelizable_groups=plan.parallelizable,
-                status="success",
-            )
+            return self._route_impl(intent.type, intent.context)
+        except (UnknownIntentError, MissingContextError, ValueError) as e:
+            return self._error_decision(intent.type, str(e))
+    
+    def _route_impl(self, intent_type: str, context: Dict[str, Any]) -> OrchestrationDecision:
+        """Route an already-validated intent; errors propagate to the caller.
+        
+        Internal callers that hold a validated intent (retries, queue
+        workers) can call this directly and skip route()'s checks.
+        
+        Args:
+            intent_type: The intent type
+            context: The intent context
+            
+        Returns:
+            OrchestrationDecision with the execution plan
             
-            return decision
+        Raises:
+            UnknownIntentError: If intent type is not registered
+            MissingContextError: If required context fields are missing
+        """
+        # Reuse a previous decision for the same intent shape
+        cache_key = (intent_type, frozenset(context))
+        with self._plan_cache_lock:
+            cached = self._plan_cache.get(cache_key)
+            if cached is not None:
+                self._plan_cache.move_to_end(cache_key)
+                self._plan_cache_hits += 1
+                # Fresh agents list so callers can't mutate the cached entry
+                return replace(cached, agents=list(cached.agents))
+            self._plan_cache_misses += 1
+        
+        # Apply routing rules
+        plan = apply_rules(intent_type, context)
+        
+        # Build decision
+        decision = OrchestrationDecision(
+            intent_type=intent_type,
+            agents=list(plan.agents),
+            execution_plan=plan,
+            parallelizable_groups=plan.parallelizable,
+            status="success",
+        )
+        
+        with self._plan_cache_lock:
+            self._plan_cache[cache_key] = decision
+            if len(self._plan_cache) > self.PLAN_CACHE_SIZE:
+                # Drop the least recently used entry
+                self._plan_cache.popitem(last=False)
+        
+        return replace(decision, agents=list(decision.agents))
+    
+    def invalidate_route_cache(self) -> None:
+        """Drop all cached routing decisions (e.g. after DECISION_RULES changes)."""
+        with self._plan_cache_lock:
+            self._plan_cache.clear()
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Return routing cache statistics.
+        
+        Returns:
+            Dict with hits, misses, current size and max size
+        """
+        with self._plan_cache_lock:
+            return {
+                "hits": self._plan_cache_hits,
+                "misses": self._plan_cache_misses,
+                "size": len(self._plan_cache),
+                "max_size": self.PLAN_CACHE_SIZE,
+            }
+    
+    @staticmethod
+    def _error_decision(intent_type: str, error: str) -> OrchestrationDecision:
+        """Build the decision returned when routing fails."""
+        return OrchestrationDecision(
+            intent_type=intent_type,
+            agents=[],
+            execution_plan=None,
+            parallelizable_groups=[],
+            status="error",
+            error=error,
+        )
+    
+    def _execution_groups(self, decision: OrchestrationDecision) -> List[List[int]]:
+        """Split the plan into groups of task indices to run together.
+        
+        Each parallelizable set becomes one group, scheduled at the
+        position of its first task. All other tasks run on their own.
+        
+        Args:
+            decision: Successful routing decision
             
-        except (UnknownIntentError, MissingContextError, ValueError) as e:
-            # Return error decision
-            return OrchestrationDecision(
-                intent_type=intent.type if isinstance(intent, Intent) else "unknown",
-                agents=[],
-                execution_plan=None,
-                parallelizable_groups=[],
-                status="error",
-                error=str(e),
-            )
+        Returns:
+            Ordered list of task-index groups
+        """
+        n = len(decision.execution_plan.tasks)
+        group_of = {}
+        for group in decision.parallelizable_groups or []:
+            members = sorted(i for i in group if 0 <= i < n)
+            for i in members:
+                group_of.setdefault(i, members)
+        
+        groups = []
+        scheduled = set()
+        for i in range(n):
+            if i in scheduled:
+                continue
+            group = [j for j in group_of.get(i, [i]) if j not in scheduled]
+            scheduled.update(group)
+            groups.append(group)
+        return groups
+    
+    def _acquire_agent(self, agent_name: str) -> Any:
+        """Check out an agent instance for exclusive use.
+        
+        The instance from _get_agent() is handed out first; extra instances
+        are only built while it is busy in a concurrent task.
+        
+        Args:
+            agent_name: Name of the agent
+            
+        Returns:
+            Agent instance (return it with _release_agent)
+        """
+        with self._agent_pool_lock:
+            idle = self._idle_agents.get(agent_name)
+            if idle is None:
+                idle = self._idle_agents[agent_name] = [self._get_agent(agent_name)]
+            if idle:
+                return idle.pop()
+        
+        factory = _AGENT_FACTORIES.get(agent_name)
+        if factory is None:
+            # Injected agent without a factory: nothing to clone, share it
+            return self._get_agent(agent_name)
+        return factory()
+    
+    def _release_agent(self, agent_name: str, agent: Any) -> None:
+        """Return an agent instance checked out with _acquire_agent.
+        
+        At most MAX_PER_AGENT instances are kept idle; instances released
+        beyond that are dropped. An injected agent shared between
+        concurrent tasks is released once per checkout, so duplicates are
+        skipped by identity (the idle list is capped, so the scan is short).
+        """
+        with self._agent_pool_lock:
+            idle = self._idle_agents.setdefault(agent_name, [])
+            if len(idle) >= self.MAX_PER_AGENT:
+                return
+            if any(instance is agent for instance in idle):
+                return
+            idle.append(agent)
+    
+    async def _run_task(self, task: Any, context: Dict[str, Any], inline: bool = False) -> Any:
+        """Run one agent without blocking the event loop.
+        
+        Agents exposing a native `async def aexecute(context)` are awaited
+        directly. Plain `execute()` calls are blocking (LLM requests,
+        subprocesses), so they run in the loop's default executor.
+        
+        Args:
+            task: AgentTask to execute
+            context: Intent context passed to the agent
+            inline: Call the agent on the caller's thread without awaiting
+                anything (the synchronous fast path of execute())
+            
+        Returns:
+            Agent output
+        """
+        agent = self._acquire_agent(task.agent)
+        try:
+            aexecute = getattr(agent, "aexecute", None)
+            if inspect.iscoroutinefunction(aexecute):
+                if inline:
+                    return self._run_sync(aexecute(context))
+                return await aexecute(context)
+            if inline:
+                return agent.execute(context)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, agent.execute, context)
+        finally:
+            self._release_agent(task.agent, agent)
     
     def execute(self, intent: Intent) -> PipelineResult:
         """Execute the full pipeline for an intent (execution phase).
         
+        Plans without parallel groups (every DECISION_RULES plan today)
+        run agents one by one on the caller's thread, with no event loop.
+        Plans with parallel groups go through execute_async(); when called
+        from a thread that already runs an event loop, that pipeline runs
+        on a helper thread instead.
+        
+        Args:
+            intent: The user intent to fulfill
+            
+        Returns:
+            PipelineResult with execution status, agent outputs, and trace ID
+        """
+        decision = self.route(intent)
+        if decision.status == "success" and any(
+            len(group) > 1 for group in self._execution_groups(decision)
+        ):
+            return self._run_sync(self.execute_async(intent))
+        
+        # Sequential fast path: with inline=True nothing in the stream
+        # suspends, so it can be stepped without an event loop
+        stream = self._execute_stream(intent, inline=True)
+        while True:
+            item = self._step_inline(stream.__anext__())
+            if isinstance(item, PipelineResult):
+                self._step_inline(stream.aclose())
+                return item
+    
+    @staticmethod
+    def _step_inline(awaitable: Any) -> Any:
+        """Run an awaitable that never suspends, without an event loop."""
+        try:
+            awaitable.send(None)
+        except StopIteration as e:
+            return e.value
+        awaitable.close()
+        raise RuntimeError("inline pipeline step suspended")
+    
+    def execute_batch(self, intents: List[Intent]) -> List[PipelineResult]:
+        """Execute many intents, routing each intent shape once.
+        
+        Intents are grouped by plan cache key (type and context keys) and
+        each group is routed once; every pipeline in the group reuses that
+        decision. All pipelines share one event loop. They run one after
+        another in input order because development pipelines share the git
+        working tree, and agents expose no batch entry point to hand a
+        whole group to.
+        
+        Args:
+            intents: Intents to fulfill
+            
+        Returns:
+            One PipelineResult per intent, in input order
+        """
+        keys: List[Any] = []
+        groups: Dict[Any, List[int]] = defaultdict(list)
+        for position, intent in enumerate(intents):
+            # Non-Intent inputs are rejected by _execute_stream itself
+            key = (intent.type, frozenset(intent.context)) if isinstance(intent, Intent) else None
+            keys.append(key)
+            groups[key].append(position)
+        
+        async def run_all() -> List[PipelineResult]:
+            decisions = {
+                key: self.route(intents[positions[0]])
+                for key, positions in groups.items()
+                if key is not None
+            }
+            results = []
+            for intent, key in zip(intents, keys):
+                decision = decisions.get(key)
+                if decision is not None:
+                    # Own agents list per pipeline, as route() would return
+                    decision = replace(decision, agents=list(decision.agents))
+                async for item in self._execute_stream(intent, decision=decision):
+                    result = item
+                results.append(result)
+            return results
+        
+        return self._run_sync(run_all())
+    
+    @staticmethod
+    def _run_sync(coro: Any) -> Any:
+        """Run a coroutine to completion from synchronous code.
+        
+        When called from a thread that already runs an event loop, the
+        coroutine runs on a helper thread instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+    
+    async def execute_async(self, intent: Intent) -> PipelineResult:
+        """Execute the full pipeline for an intent (execution phase).
+        
         Sequence:
         1. Create execution trace
         2. Route the intent (planning)
-        3. Execute agents in order
+        3. Execute agents in order; parallelizable groups run concurrently
         4. Record each step in trace
-        5. Stop on first failure
+        5. Stop on first failure (after the current group completes)
         6. Return complete results with trace ID
         
         Args:
@@ -387,11 +765,86 @@ class Orchestrator:
         Returns:
             PipelineResult with execution status, agent outputs, and trace ID
         """
+        async for item in self._execute_stream(intent):
+            result = item
+        return result
+    
+    # Async entry point under the conventional a-prefixed name
+    aexecute = execute_async
+    
+    def execute_iter(
+        self, intent: Intent
+    ) -> Generator[AgentExecutionResult, None, PipelineResult]:
+        """Execute the pipeline, yielding each agent result as it completes.
+        
+        Lets callers (CLI, streaming endpoints) report progress before the
+        pipeline finishes. The PipelineResult is the generator's return
+        value, i.e. StopIteration.value (or the value of `yield from`).
+        
+        Args:
+            intent: The user intent to fulfill
+            
+        Yields:
+            AgentExecutionResult for each agent, in plan order
+            
+        Returns:
+            PipelineResult with execution status, agent outputs, and trace ID
+        """
+        stream = self._execute_stream(intent)
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pool = None
+        else:
+            # Caller's thread already runs a loop; drive ours on a helper thread
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
+        def run(awaitable):
+            if pool is None:
+                return loop.run_until_complete(awaitable)
+            return pool.submit(loop.run_until_complete, awaitable).result()
+        
+        try:
+            while True:
+                item = run(stream.__anext__())
+                if isinstance(item, PipelineResult):
+                    return item
+                yield item
+        finally:
+            run(stream.aclose())
+            run(loop.shutdown_default_executor())
+            loop.close()
+            if pool is not None:
+                pool.shutdown()
+    
+    async def _execute_stream(
+        self,
+        intent: Intent,
+        inline: bool = False,
+        decision: Optional[OrchestrationDecision] = None,
+    ) -> AsyncIterator[Union[AgentExecutionResult, PipelineResult]]:
+        """Run the pipeline, yielding agent results and finally the PipelineResult.
+        
+        Shared core of execute(), execute_async(), execute_iter() and
+        execute_batch(); the last item yielded is always the PipelineResult.
+        With inline=True (sequential plans only) agents and git operations
+        run on the caller's thread and the stream never suspends. A
+        decision already routed for this intent skips the planning step.
+        """
+        
+        # Validate before touching intent fields to build the trace
+        if type(intent) is not Intent and not isinstance(intent, Intent):
+            yield self._result(
+                "unknown", "failure", [],
+                error="Orchestration error: Input must be an Intent object",
+            )
+            return
         
         # Create execution trace
-        trace_id = str(uuid.uuid4())
+        trace_id = uuid.uuid4().hex
         trigger = TriggerInfo(
-            source=intent.metadata.get("source", "unknown") if intent.metadata else "unknown",
+            source=(intent.metadata or _EMPTY).get("source", "unknown"),
             issue_key=intent.context.get("issue_key"),
             intent_type=intent.type,
         )
@@ -408,170 +861,202 @@ class Orchestrator:
         get_trace_store().store(trace)
         
         try:
-            # Validate intent
-            if not isinstance(intent, Intent):
-                trace.complete(PipelineStatus.FAILED, "Input must be an Intent object")
-                raise ValueError("Input must be an Intent object")
-            
             # Plan the pipeline
-            decision = self.route(intent)
+            if decision is None:
+                decision = self.route(intent)
             if decision.status == "error":
                 trace.complete(PipelineStatus.FAILED, decision.error)
-                return PipelineResult(
-                    intent_type=intent.type,
-                    status="failure",
-                    agent_results=[],
-                    error=decision.error,
-                    trace_id=trace_id,
-                )
+                yield self._result(intent.type, "failure", [], trace_id, error=decision.error)
+                return
             
             # Record execution plan in trace
-            agents_summary = " → ".join([t.agent for t in decision.execution_plan.tasks])
-            trace.execution_plan_summary = agents_summary
+            trace.execution_plan_summary = decision.execution_plan.summary
             
-            # Execute agents sequentially
-            agent_results = []
+            # Results are pre-sized and assigned by plan index so groups can
+            # complete out of order; early exits drop unfilled slots.
+            tasks = decision.execution_plan.tasks
+            agent_results: List[Optional[AgentExecutionResult]] = [None] * len(tasks)
             final_commit = None
             
-            for i, task in enumerate(decision.execution_plan.tasks):
-                try:
-                    # Record step start
-                    step = trace.add_step(
-                        agent_name=task.agent,
-                        agent_task=task.task,
+            for group in self._execution_groups(decision):
+                # Record step start for every task in the group
+                steps = {}
+                for i in group:
+                    steps[i] = trace.add_step(
+                        agent_name=tasks[i].agent,
+                        agent_task=tasks[i].task,
                         status=StepStatus.STARTED,
                     )
-                    
-                    # Get agent instance
-                    agent = self._get_agent(task.agent)
-                    
-                    # Execute agent
-                    print(f"\n▶ Executing {task.agent}: {task.task}")
-                    output = agent.execute(intent.context)
-                    
-                    # POST-EXECUTION HOOK: If development_agent, run git operations
-                    if task.agent == "development_agent" and output.success:
-                        print(f"  📝 Development agent completed. Processing git operations...")
-                        git_result = self._execute_git_operations(output, intent.context, trace, step)
+                    logger.info("▶ Executing %s: %s", tasks[i].agent, tasks[i].task)
+                
+                # Execute the group; a single task is just a group of one
+                if len(group) == 1:
+                    try:
+                        outputs = [await self._run_task(tasks[group[0]], intent.context, inline)]
+                    except Exception as e:
+                        outputs = [e]
+                else:
+                    outputs = await asyncio.gather(
+                        *(self._run_task(tasks[i], intent.context) for i in group),
+                        return_exceptions=True,
+                    )
+                
+                # Settle every member of the group in plan order before
+                # stopping, so no step is left STARTED. `stop` holds the
+                # first failure: (pipeline error, keep final_commit)
+                stop: Optional[Tuple[str, bool]] = None
+                for i, output in zip(group, outputs):
+                    task = tasks[i]
+                    step = steps[i]
+                    try:
+                        if isinstance(output, BaseException):
+                            raise output
                         
-                        if not git_result:
-                            # Git operations failed - stop pipeline
-                            return PipelineResult(
-                                intent_type=intent.type,
-                                status="partial",
-                                agent_results=agent_results,
-                                error="Git operations failed after development_agent",
-                                trace_id=trace_id,
-                            )
+                        # POST-EXECUTION HOOK: If development_agent, run git
+                        # operations (skipped once the group has failed)
+                        if task.agent == "development_agent" and output.success and stop is None:
+                            logger.info("📝 Development agent completed. Processing git operations...")
+                            if inline:
+                                git_result = self._execute_git_operations(
+                                    output, intent.context, trace, step
+                                )
+                            else:
+                                # GitService shells out and writes files; keep
+                                # it off the event loop like the sync agents
+                                git_result = await asyncio.get_running_loop().run_in_executor(
+                                    None, self._execute_git_operations,
+                                    output, intent.context, trace, step,
+                                )
+                            
+                            if not git_result:
+                                # Git operations failed (step and trace already
+                                # marked) - stop pipeline
+                                stop = ("Git operations failed after development_agent", False)
+                                continue
+                            
+                            # Git succeeded - extract commit hash
+                            final_commit = git_result
+                            logger.info("✓ Git operations completed. Commit: %s", final_commit)
                         
-                        # Git succeeded - extract commit hash
-                        final_commit = git_result
-                        print(f"  ✓ Git operations completed. Commit: {final_commit}")
-                    
-                    # Centralized failure detection for ALL agents
-                    should_continue, error_message = self._check_agent_result(task.agent, output)
-                    
-                    if not should_continue:
-                        # Agent failed or blocked - stop pipeline
+                        # Centralized failure detection for ALL agents
+                        should_continue, error_message, step_status = self._check_agent_result(
+                            task.agent, output
+                        )
                         
-                        # Determine step status based on error type
-                        if "BLOCKED" in error_message or "BLOCK" in error_message:
-                            step_status = StepStatus.BLOCKED
-                        else:
-                            step_status = StepStatus.FAIL
+                        if not should_continue:
+                            # Agent failed or blocked - stop pipeline
+                            trace.update_step(
+                                step_number=step.step_number,
+                                status=step_status,
+                                success=False,
+                                error_message=error_message,
+                            )
+                            
+                            agent_results[i] = AgentExecutionResult(
+                                agent=task.agent,
+                                success=False,
+                                output=output,
+                                error=error_message,
+                            )
+                            yield agent_results[i]
+                            
+                            if stop is None:
+                                trace.complete(PipelineStatus.PARTIAL, error_message)
+                                stop = (error_message, False)
+                            continue
                         
+                        # Agent succeeded
                         trace.update_step(
                             step_number=step.step_number,
-                            status=step_status,
-                            success=False,
-                            error_message=error_message,
+                            status=StepStatus.SUCCESS,
+                            success=True,
+                            output_summary=self._get_output_summary(task.agent, output),
                         )
                         
-                        agent_results.append(AgentExecutionResult(
+                        agent_results[i] = AgentExecutionResult(
                             agent=task.agent,
-                            success=False,
+                            success=True,
                             output=output,
-                            error=error_message,
-                        ))
+                        )
+                        yield agent_results[i]
+                        
+                        # Extract commit hash if available
+                        if hasattr(output, 'commit_hash') and output.commit_hash:
+                            final_commit = output.commit_hash
                         
-                        trace.complete(PipelineStatus.PARTIAL, error_message)
+                        logger.info("✓ %s completed successfully", task.agent)
                         
-                        return PipelineResult(
-                            intent_type=intent.type,
-                            status="partial",
-                            agent_results=agent_results,
-                            error=error_message,
-                            trace_id=trace_id,
+                    except Exception as e:
+                        # Execution error - update trace
+                        err = str(e)
+                        pipeline_error = f"Error executing {task.agent}: {err}"
+                        trace.update_step(
+                            step_number=step.step_number,
+                            status=StepStatus.FAIL,
+                            success=False,
+                            error_message=err,
                         )
-                    
-                    # Agent succeeded
-                    trace.update_step(
-                        step_number=step.step_number,
-                        status=StepStatus.SUCCESS,
-                        success=True,
-                        output_summary=self._get_output_summary(task.agent, output),
-                    )
-                    
-                    agent_results.append(AgentExecutionResult(
-                        agent=task.agent,
-                        success=True,
-                        output=output,
-                    ))
-                    
-                    # Extract commit hash if available
-                    if hasattr(output, 'commit_hash') and output.commit_hash:
-                        final_commit = output.commit_hash
-                    
-                    print(f"✓ {task.agent} completed successfully")
-                    
-                except Exception as e:
-                    # Execution error - update trace
-                    trace.update_step(
-                        step_number=len(trace.steps),
-                        status=StepStatus.FAIL,
-                        success=False,
-                        error_message=str(e),
-                    )
-                    
-                    agent_results.append(AgentExecutionResult(
-                        agent=task.agent,
-                        success=False,
-                        error=str(e),
-                    ))
-                    
-                    trace.complete(PipelineStatus.PARTIAL, f"Error executing {task.agent}: {str(e)}")
-                    
-                    # Stop pipeline on error
-                    return PipelineResult(
-                        intent_type=intent.type,
-                        status="partial",
-                        agent_results=agent_results,
-                        final_commit=final_commit,
-                        error=f"Error executing {task.agent}: {str(e)}",
-                        trace_id=trace_id,
+                        
+                        agent_results[i] = AgentExecutionResult(
+                            agent=task.agent,
+                            success=False,
+                            error=err,
+                        )
+                        yield agent_results[i]
+                        
+                        if stop is None:
+                            trace.complete(PipelineStatus.PARTIAL, pipeline_error)
+                            stop = (pipeline_error, True)
+                
+                if stop is not None:
+                    # Stop pipeline on the group's first failure
+                    error, keep_commit = stop
+                    yield self._result(
+                        intent.type, "partial", agent_results, trace_id,
+                        final_commit=final_commit if keep_commit else None, error=error,
                     )
+                    return
             
             # All agents succeeded
             trace.complete(PipelineStatus.SUCCESS)
             
-            return PipelineResult(
-                intent_type=intent.type,
-                status="success",
-                agent_results=agent_results,
-                final_commit=final_commit,
-                trace_id=trace_id,
+            yield self._result(
+                intent.type, "success", agent_results, trace_id, final_commit=final_commit
             )
+            return
             
         except Exception as e:
             trace.complete(PipelineStatus.FAILED, f"Orchestration error: {str(e)}")
             
-            return PipelineResult(
-                intent_type=intent.type if isinstance(intent, Intent) else "unknown",
-                status="failure",
-                agent_results=[],
-                error=f"Orchestration error: {str(e)}",
-                trace_id=trace_id,
+            yield self._result(
+                intent.type, "failure", [], trace_id, error=f"Orchestration error: {str(e)}"
             )
+            return
+    
+    
+    @staticmethod
+    def _result(
+        intent_type: str,
+        status: str,
+        agent_results: List[Optional[AgentExecutionResult]],
+        trace_id: Optional[str] = None,
+        final_commit: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> PipelineResult:
+        """Build the PipelineResult for any pipeline exit point.
+        
+        Partial runs drop the unfilled slots of agents that never ran.
+        """
+        if status == "partial":
+            agent_results = [r for r in agent_results if r is not None]
+        return PipelineResult(
+            intent_type=intent_type,
+            status=status,
+            agent_results=agent_results,
+            final_commit=final_commit,
+            error=error,
+            trace_id=trace_id,
+        )
     
     def _get_output_summary(self, agent_name: str, output: Any) -> str:
         """Generate a brief summary of agent output for tracing.
@@ -598,21 +1083,28 @@ class Orchestrator:
         Returns:
             Dict mapping intent types to required context fields
         """
-        intents = {}
-        for intent_type in list_available_intents():
-            intents[intent_type] = get_intent_requirements(intent_type)
-        return intents
+        global _available_intents
+        # Rebuild only if intents were registered/removed after import
+        if _available_intents.keys() != DECISION_RULES.keys():
+            _available_intents = list_intent_requirements()
+        return dict(_available_intents)
 
 # Singleton instance for convenience
 _default_orchestrator = None
+_default_orchestrator_lock = threading.Lock()
 
 
 def get_orchestrator() -> Orchestrator:
-    """Get or create the default orchestrator instance."""
+    """Get or create the default orchestrator instance (thread-safe)."""
     global _default_orchestrator
-    if _default_orchestrator is None:
-        _default_orchestrator = Orchestrator()
-    return _default_orchestrator
+    orchestrator = _default_orchestrator
+    if orchestrator is not None:
+        return orchestrator
+    
+    with _default_orchestrator_lock:
+        if _default_orchestrator is None:
+            _default_orchestrator = Orchestrator()
+        return _default_orchestrator
 
 
 def route(intent: Intent) -> OrchestrationDecision:
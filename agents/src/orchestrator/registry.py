@@ -3,9 +3,10 @@
 Maps intents to agent execution sequences without executing agents.
 """
 
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 
 class AgentType(str, Enum):
@@ -18,7 +19,7 @@ class AgentType(str, Enum):
     TESTING_AGENT = "testing_agent"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
     """Definition of an agent and what it should do.
     
@@ -33,7 +34,7 @@ class AgentTask:
     params: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionPlan:
     """Ordered sequence of agents to execute.
     
@@ -41,16 +42,50 @@ class ExecutionPlan:
         intent_type: The intent that generated this plan
         sequence: List of agent tasks in execution order
         parallelizable: Set of agent indices that can run in parallel
+        agents: Agent names in execution order (derived from sequence once)
+        reasoning: Human-readable explanation of the plan (derived once)
     """
     
     intent_type: str
     sequence: List[AgentTask]
     parallelizable: List[set] = None
+    agents: Tuple[str, ...] = field(init=False, repr=False)
+    reasoning: str = field(init=False, repr=False)
     
     def __post_init__(self):
-        """Set default parallelizable groups."""
+        """Set default parallelizable groups and derive agents and reasoning."""
         if self.parallelizable is None:
             self.parallelizable = []
+        self.agents = tuple(task.agent.value for task in self.sequence)
+        self.reasoning = self._explain()
+    
+    def _explain(self) -> str:
+        """Generate a human-readable explanation of this plan.
+        
+        Returns:
+            A string explaining which agents run, in what order
+        """
+        agent_tasks = [
+            f"{i+1}. {task.agent.value}: {task.task}"
+            for i, task in enumerate(self.sequence)
+        ]
+        
+        agents_str = "\n  ".join(agent_tasks)
+        
+        explanation = (
+            f"Intent '{self.intent_type}' routed to:\n"
+            f"  {agents_str}"
+        )
+        
+        if self.parallelizable:
+            parallel_groups = [
+                f"Group {i}: agents {group}"
+                for i, group in enumerate(self.parallelizable)
+            ]
+            parallel_str = "\n  ".join(parallel_groups)
+            explanation += f"\n\nParallelize-able agent groups:\n  {parallel_str}"
+        
+        return explanation
 
 
 class AgentRegistry:
@@ -60,8 +95,8 @@ class AgentRegistry:
     not how it happens or whether it succeeds.
     """
     
-    # Routing rules: IntentType -> ExecutionPlan
-    ROUTES = {
+    # Routing rules: IntentType -> ExecutionPlan (read-only view)
+    ROUTES = MappingProxyType({
         "register_event": ExecutionPlan(
             intent_type="register_event",
             sequence=[
@@ -131,7 +166,7 @@ class AgentRegistry:
             ],
             parallelizable=[],
         ),
-    }
+    })
     
     @classmethod
     def get_route(cls, intent_type: str) -> ExecutionPlan:
@@ -146,13 +181,14 @@ class AgentRegistry:
         Raises:
             ValueError: If intent type is not registered
         """
-        if intent_type not in cls.ROUTES:
+        plan = cls.ROUTES.get(intent_type)
+        if plan is None:
             available = ", ".join(cls.ROUTES.keys())
             raise ValueError(
                 f"Unknown intent type: {intent_type}. "
                 f"Available: {available}"
             )
-        return cls.ROUTES[intent_type]
+        return plan
     
     @classmethod
     def list_routes(cls) -> List[str]:
@@ -5,25 +5,25 @@ No agent invocation, no LLMs—pure routing logic.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
-from agents.src.orchestrator.intent import Intent, IntentType
-from agents.src.orchestrator.registry import AgentRegistry, ExecutionPlan, AgentTask
+from typing import Dict, List, Optional, Tuple
+from orchestrator.intent import Intent, IntentType
+from orchestrator.registry import AgentRegistry, ExecutionPlan, AgentTask
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionResult:
     """Result of routing an intent.
     
     Attributes:
         intent_type: The intent that was routed
-        agents_to_run: List of agents in execution order
+        agents_to_run: Agent names in execution order
         execution_plan: Full execution plan with parameters
         parallelizable_groups: Sets of agent indices that can run in parallel
         reasoning: Human-readable explanation of the decision
     """
     
     intent_type: str
-    agents_to_run: List[str]
+    agents_to_run: Tuple[str, ...]
     execution_plan: ExecutionPlan
     parallelizable_groups: List[set]
     reasoning: str
@@ -39,10 +39,18 @@ class DecisionRouter:
     def __init__(self):
         """Initialize the router with the agent registry."""
         self.registry = AgentRegistry()
+        # A decision depends only on the intent type, so build them up front
+        self._cache: Dict[str, DecisionResult] = {
+            intent_type: self._build_result(intent_type, plan)
+            for intent_type, plan in self.registry.ROUTES.items()
+        }
     
     def route(self, intent: Intent) -> DecisionResult:
         """Decide which agents should run for the given intent.
         
+        Results are shared between calls for the same intent type and
+        must not be mutated.
+        
         Args:
             intent: The user intent to fulfill
             
@@ -52,54 +60,33 @@ class DecisionRouter:
         Raises:
             ValueError: If the intent type is not recognized
         """
-        # Look up the routing rule
-        plan = self.registry.get_route(intent.type.value)
-        
-        # Extract agent names from the plan
-        agents = [task.agent.value for task in plan.sequence]
+        # Intent.type may be an IntentType or its plain string value
+        intent_type = getattr(intent.type, "value", intent.type)
         
-        # Generate a reasoning explanation
-        reasoning = self._explain_decision(intent, plan)
-        
-        return DecisionResult(
-            intent_type=intent.type.value,
-            agents_to_run=agents,
-            execution_plan=plan,
-            parallelizable_groups=plan.parallelizable,
-            reasoning=reasoning,
-        )
+        result = self._cache.get(intent_type)
+        if result is None:
+            # Not prebuilt: raises ValueError for unknown intent types
+            plan = self.registry.get_route(intent_type)
+            result = self._cache[intent_type] = self._build_result(intent_type, plan)
+        return result
     
-    def _explain_decision(self, intent: Intent, plan: ExecutionPlan) -> str:
-        """Generate a human-readable explanation of the routing decision.
+    def _build_result(self, intent_type: str, plan: ExecutionPlan) -> DecisionResult:
+        """Build the routing decision for an intent type.
         
         Args:
-            intent: The intent being routed
-            plan: The execution plan that was selected
+            intent_type: The intent type being routed
+            plan: The execution plan registered for it
             
         Returns:
-            A string explaining the decision
+            DecisionResult with agents and reasoning filled in
         """
-        agent_tasks = [
-            f"{i+1}. {task.agent.value}: {task.task}"
-            for i, task in enumerate(plan.sequence)
-        ]
-        
-        agents_str = "\n  ".join(agent_tasks)
-        
-        explanation = (
-            f"Intent '{intent.type.value}' routed to:\n"
-            f"  {agents_str}"
+        return DecisionResult(
+            intent_type=intent_type,
+            agents_to_run=plan.agents,
+            execution_plan=plan,
+            parallelizable_groups=plan.parallelizable,
+            reasoning=plan.reasoning,
         )
-        
-        if plan.parallelizable:
-            parallel_groups = [
-                f"Group {i}: agents {group}"
-                for i, group in enumerate(plan.parallelizable)
-            ]
-            parallel_str = "\n  ".join(parallel_groups)
-            explanation += f"\n\nParallelize-able agent groups:\n  {parallel_str}"
-        
-        return explanation
     
     def get_available_intents(self) -> List[str]:
         """Return all available intent types."""
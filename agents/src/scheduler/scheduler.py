@@ -7,25 +7,141 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 import asyncio
+import concurrent.futures
+import contextlib
+import heapq
+import itertools
 import os
-from typing import List, Tuple
+import time
+from typing import Dict, List, Optional, Set, Tuple
 import httpx
 import logging
 
+from src.agents.code_review_agent import CodeReviewAgent
+from src.agents.jira_agent import JiraAgent
+from src.agents.testing_agent import TestingAgent
+
 logger = logging.getLogger(__name__)
 
+
+class _PriorityGate:
+    """Async semaphore that admits waiters in priority order.
+    
+    Unlike asyncio.Semaphore, which wakes waiters first come first served,
+    a freed place goes to the waiter with the lowest priority value,
+    oldest first.
+    """
+    
+    def __init__(self, capacity: int):
+        self.free = capacity
+        # Heap of (priority, seq, future), woken in order
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+    
+    @contextlib.asynccontextmanager
+    async def hold(self, priority: int):
+        """Hold one place for the duration of the block."""
+        if self.free > 0 and not self.waiters:
+            self.free -= 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self.waiters, (priority, next(self._seq), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # A place handed over just before cancellation must be passed on
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+    
+    def _release(self):
+        """Hand a freed place to the highest-priority live waiter, if any."""
+        while self.waiters:
+            _, _, waiter = heapq.heappop(self.waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.free += 1
+
+
 class AgentScheduler:
     """Manages scheduled execution of AI agents."""
     
+    # JQL per stage, polled together as one query per tick
+    JQL_WAITING_DEVELOPMENT = 'status = "Waiting Development" AND assignee is EMPTY'
+    JQL_IN_REVIEW = 'status in ("Code Review", "In Review")'
+    JQL_TESTING = 'status = "Testing"'
+    JQL_ALL = f"({JQL_WAITING_DEVELOPMENT}) OR ({JQL_IN_REVIEW}) OR ({JQL_TESTING})"
+    
+    # Trigger kind -> (agent name, log icon, verb, past tense, runner method)
+    TRIGGERS = {
+        "develop": ("JiraAgent", "🚀", "Processing", "processed", "_run_jira_agent"),
+        "review": ("CodeReviewAgent", "🔍", "Reviewing", "reviewed", "_run_code_review_agent"),
+        "test": ("TestingAgent", "🧪", "Testing", "tested", "_run_testing_agent"),
+    }
+    
+    # Jira status -> trigger kind, for polled issues and webhook pushes
+    STATUS_TRIGGERS = {
+        "Waiting Development": "develop",
+        "Code Review": "review",
+        "In Review": "review",
+        "Testing": "test",
+    }
+    
+    # Trigger kind -> priority for slots, the workspace and the webhook queue;
+    # lower runs first, so new development work never starves behind tests
+    PRIORITIES = {"develop": 0, "review": 1, "test": 2}
+    
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self._jira_client = None
+        # One connection pool for Jira and agent HTTP calls; all scheduler
+        # HTTP traffic must go through it
+        self._http: Optional[httpx.AsyncClient] = None
         # Cache env vars at init time (before scheduler starts)
         self.jira_url = os.getenv("JIRA_URL")
         self.jira_username = os.getenv("JIRA_USERNAME")
         self.jira_token = os.getenv("JIRA_API_TOKEN")
         self.ai_management_url = os.getenv("AI_MANAGEMENT_URL")
         self.git_repo_path = os.getenv("GIT_REPO_PATH", "/tmp/repo")
+        # Max issues processed concurrently across all jobs
+        self.max_concurrency = int(os.getenv("SCHED_MAX_CONCURRENCY", "8"))
+        # Shared by all jobs so overlapping ticks respect one global cap
+        self._slots = _PriorityGate(self.max_concurrency)
+        self._seq = itertools.count()
+        # Threads for blocking agent work (pytest runs, file scans); built
+        # on first use and dropped by stop() so start() can run again
+        self.io_workers = int(os.getenv("SCHED_IO_WORKERS", "4"))
+        self._io_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Max issues fetched per polling sweep (all stages combined)
+        self.max_results = int(os.getenv("SCHED_MAX_RESULTS", "500"))
+        # Seconds between polling sweeps; can be raised when webhooks push updates
+        self.poll_interval = int(os.getenv("SCHED_POLL_INTERVAL", "30"))
+        # Webhook-pushed (priority, seq, kind, issue_key) entries, drained
+        # by a single consumer that starts one dispatch task per entry
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+        # Background per-stage fan-outs started by polling sweeps
+        self._fan_outs: Set[asyncio.Task] = set()
+        # Seconds an issue is skipped after being triggered for the same kind
+        self.dedupe_ttl = float(os.getenv("SCHED_DEDUPE_TTL", "300"))
+        self._recent: Dict[Tuple[str, str], float] = {}
+        # (kind, issue_key) pairs whose agent is running right now
+        self._in_flight: Set[Tuple[str, str]] = set()
+        # Agents are built on first use and reused across ticks
+        self._jira_agent = None
+        self._code_review_agent = None
+        self._testing_agent = None
+        # Development (branch checkout, commit, push), review (reads the
+        # checked-out changes) and testing (pytest) all work in the single
+        # GIT_REPO_PATH checkout, so one issue uses it at a time, handed
+        # over in PRIORITIES order
+        self._workspace = _PriorityGate(1)
     
     def start(self):
         """Start the scheduler."""
@@ -33,173 +149,330 @@ class AgentScheduler:
             logger.warning("Scheduler already running")
             return
         
-        # Add scheduled jobs (every 30 seconds)
-        self.scheduler.add_job(
-            self._process_development_waiting,
-            IntervalTrigger(seconds=30),
-            id='process_development_waiting',
-            name='Process Development Waiting tasks',
-            misfire_grace_time=60
-        )
-        
+        # One polling job covers every stage. It only searches and starts
+        # background fan-outs, so agent runs never hold it up. A search
+        # that overruns the interval makes the next one skip
+        # (max_instances=1), missed runs collapse into one (coalesce), and
+        # a run more than one interval late is dropped since the next
+        # tick covers it.
         self.scheduler.add_job(
-            self._process_in_review,
-            IntervalTrigger(seconds=30),
-            id='process_in_review',
-            name='Process In Review tasks',
-            misfire_grace_time=60
-        )
-        
-        self.scheduler.add_job(
-            self._process_testing,
-            IntervalTrigger(seconds=30),
-            id='process_testing',
-            name='Process Testing tasks',
-            misfire_grace_time=60
+            self._process_all,
+            IntervalTrigger(seconds=self.poll_interval),
+            id='process_all',
+            name='Process Waiting Development, In Review and Testing tasks',
+            misfire_grace_time=self.poll_interval,
+            max_instances=1,
+            coalesce=True
         )
         
         self.scheduler.start()
-        logger.info("✅ Scheduler started with 30-second intervals")
+        logger.info("✅ Scheduler started with %s-second intervals", self.poll_interval)
     
     def stop(self):
         """Stop the scheduler."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
+        for task in [*self._fan_outs, *self._dispatches]:
+            task.cancel()
         if self.scheduler.running:
             self.scheduler.shutdown()
             logger.info("⏹️  Scheduler stopped")
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool = None
+    
+    async def aclose(self):
+        """Release the shared HTTP client's pooled connections."""
+        if self._jira_client is not None:
+            await self._jira_client.aclose()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Lazy-create the HTTP client shared by the Jira client and agents."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=30.0,
+            )
+        return self._http
     
-    async def _get_jira_client(self):
-        """Lazy-load and return Jira client."""
+    def _get_io_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Lazy-create the thread pool for blocking agent work."""
+        if self._io_pool is None:
+            self._io_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.io_workers,
+                thread_name_prefix="sched-io",
+            )
+        return self._io_pool
+    
+    async def get_jira_client(self):
+        """Lazy-load and return the Jira client shared by jobs and API handlers."""
         if self._jira_client is None:
             from src.clients.jira_client import JiraClient
             self._jira_client = JiraClient(
                 jira_url=self.jira_url,
                 username=self.jira_username,
                 api_token=self.jira_token,
+                http_client=self._get_http_client(),
             )
         return self._jira_client
     
-    async def _process_development_waiting(self):
-        """Find and process all 'Waiting Development' tasks."""
+    async def _get_jira_agent(self):
+        """Lazy-load and return JiraAgent (shares the scheduler's HTTP clients)."""
+        if self._jira_agent is None:
+            self._jira_agent = JiraAgent(
+                jira_url=self.jira_url,
+                jira_username=self.jira_username,
+                jira_token=self.jira_token,
+                ai_management_url=self.ai_management_url,
+                git_repo_path=self.git_repo_path,
+                jira_client=await self.get_jira_client(),
+                http_client=self._get_http_client(),
+            )
+        return self._jira_agent
+    
+    def _get_code_review_agent(self):
+        """Lazy-load and return CodeReviewAgent."""
+        if self._code_review_agent is None:
+            self._code_review_agent = CodeReviewAgent(repo_root=self.git_repo_path)
+        return self._code_review_agent
+    
+    def _get_testing_agent(self):
+        """Lazy-load and return TestingAgent."""
+        if self._testing_agent is None:
+            self._testing_agent = TestingAgent(repo_root=self.git_repo_path)
+        return self._testing_agent
+    
+    async def _process_all(self):
+        """Find tasks in every handled stage with one search and process them."""
         try:
-            logger.info("🔍 Searching for 'Waiting Development' tasks...")
-            jira_client = await self._get_jira_client()
+            logger.info("🔍 Searching for 'Waiting Development', 'In Review' and 'Testing' tasks...")
+            jira_client = await self.get_jira_client()
             
-            # JQL to find all Waiting Development tasks
-            jql = 'status = "Waiting Development" AND assignee is EMPTY'
-            issues = await jira_client.search_issues(jql)
-            
-            if not issues:
-                logger.info("  No 'Waiting Development' tasks found")
-                return
-            
-            logger.info(f"  Found {len(issues)} task(s) to process")
+            issues = await jira_client.search_issues(
+                self.JQL_ALL,
+                max_results=self.max_results,
+                fields="key,status",
+            )
             
-            # Process each issue (key or id fallback)
+            # Bucket issue keys by the stage their current status maps to
+            buckets: Dict[str, List[str]] = {kind: [] for kind in self.TRIGGERS}
             for issue in issues:
-                if isinstance(issue, dict):
-                    issue_key = issue.get('key') or issue.get('id') or str(issue)
-                else:
-                    issue_key = str(issue)
-                if not issue_key:
-                    logger.warning(f"  Skipping issue without key: {issue}")
-                    continue
-                await self._trigger_jira_agent(issue_key)
-        
-        except Exception as e:
-            logger.error(f"❌ Error in _process_development_waiting: {e}")
-    
-    async def _process_in_review(self):
-        """Find and process all 'In Review' tasks."""
-        try:
-            logger.info("🔍 Searching for 'In Review' tasks...")
-            jira_client = await self._get_jira_client()
-            
-            # JQL to find all review-ready tasks
-            jql = 'status in ("Code Review", "In Review")'
-            issues = await jira_client.search_issues(jql)
+                status = issue.get("fields", {}).get("status", {}).get("name")
+                kind = self.STATUS_TRIGGERS.get(status)
+                if kind is not None and "key" in issue:
+                    buckets[kind].append(issue["key"])
             
-            if not issues:
-                logger.info("  No 'In Review' tasks found")
+            if not any(buckets.values()):
+                logger.info("  No tasks found")
                 return
             
-            logger.info(f"  Found {len(issues)} task(s) to review")
+            logger.info(
+                "  Found %s to develop, %s to review, %s to test",
+                len(buckets["develop"]), len(buckets["review"]), len(buckets["test"]),
+            )
             
-            # Process each issue
-            for issue in issues:
-                issue_key = issue.get('key')
-                await self._trigger_code_review_agent(issue_key)
+            # Stages run in the background under the shared concurrency cap,
+            # so a long pytest or development run never delays the next
+            # tick's search; _claim() skips issues still in flight
+            loop = asyncio.get_running_loop()
+            for kind, keys in buckets.items():
+                if keys:
+                    task = loop.create_task(self._fan_out(keys, kind))
+                    self._fan_outs.add(task)
+                    task.add_done_callback(self._fan_outs.discard)
         
         except Exception as e:
-            logger.error(f"❌ Error in _process_in_review: {e}")
+            logger.error("❌ Error in _process_all: %s", e)
     
-    async def _process_testing(self):
-        """Find and process all 'Testing' tasks."""
-        try:
-            logger.info("🔍 Searching for 'Testing' tasks...")
-            jira_client = await self._get_jira_client()
-            
-            # JQL to find all Testing tasks
-            jql = 'status = "Testing"'
-            issues = await jira_client.search_issues(jql)
-            
-            if not issues:
-                logger.info("  No 'Testing' tasks found")
-                return
-            
-            logger.info(f"  Found {len(issues)} task(s) to test")
+    def enqueue(self, issue_key: str, status: str) -> Optional[str]:
+        """Queue an issue pushed by the Jira webhook for processing.
+        
+        Must be called from the running event loop. A background consumer
+        takes queued issues highest priority kind first and dispatches each
+        in its own task, so a long agent run never holds up the entries
+        behind it; the concurrency slots and the workspace gate bound what
+        actually runs. Polling remains as a reconciliation sweep.
+        
+        Args:
+            issue_key: The Jira issue key
+            status: The issue's current Jira status name
             
-            # Process each issue
-            for issue in issues:
-                issue_key = issue.get('key')
-                await self._trigger_testing_agent(issue_key)
+        Returns:
+            The trigger kind the issue was queued for, or None if its
+            status is not handled
+        """
+        kind = self.STATUS_TRIGGERS.get(status)
+        if kind is None:
+            return None
         
-        except Exception as e:
-            logger.error(f"❌ Error in _process_testing: {e}")
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.get_running_loop().create_task(self._consume())
+        self._queue.put_nowait((self.PRIORITIES[kind], next(self._seq), kind, issue_key))
+        return kind
     
-    async def _trigger_jira_agent(self, issue_key: str):
-        """Trigger JiraAgent for an issue."""
-        try:
-            from src.agents.jira_agent import JiraAgent
-            
-            logger.info(f"  🚀 Processing {issue_key} with JiraAgent...")
-            agent = JiraAgent(
-                jira_url=self.jira_url,
-                jira_username=self.jira_username,
-                jira_token=self.jira_token,
-                ai_management_url=self.ai_management_url,
-                git_repo_path=self.git_repo_path,
-            )
-            result = await agent.process_task(issue_key)
-            logger.info(f"  ✅ {issue_key} processed successfully")
+    async def _consume(self):
+        """Drain webhook-pushed issues, starting their dispatches by priority."""
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, kind, issue_key = await self._queue.get()
+            task = loop.create_task(self._dispatch(kind, issue_key))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatch_done)
+    
+    def _dispatch_done(self, task: asyncio.Task):
+        """Forget a finished webhook dispatch and mark its queue entry done."""
+        self._dispatches.discard(task)
+        self._queue.task_done()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("  ❌ Error processing queued issue: %s", task.exception())
+    
+    async def _fan_out(
+        self,
+        issue_keys: List[str],
+        kind: str,
+    ):
+        """Trigger ``kind`` for every issue, at most max_concurrency at a time.
         
-        except Exception as e:
-            logger.error(f"  ❌ Error processing {issue_key}: {e}")
+        The cap is shared across stages, ticks and the webhook consumer, so
+        together they never run more than max_concurrency agents at once.
+        """
+        self._prune_recent()
+        
+        results = await asyncio.gather(
+            *(self._dispatch(kind, issue_key) for issue_key in issue_keys),
+            return_exceptions=True,
+        )
+        for issue_key, result in zip(issue_keys, results):
+            if isinstance(result, Exception):
+                logger.error("  ❌ Error processing %s: %s", issue_key, result)
     
-    async def _trigger_code_review_agent(self, issue_key: str):
-        """Trigger CodeReviewAgent for an issue."""
-        try:
-            from src.agents.code_review_agent import CodeReviewAgent
+    async def run_now(self, kind: str, issue_key: str) -> bool:
+        """Run ``kind`` on one issue now, for API handlers.
+        
+        Goes through the same dedupe, workspace gate and concurrency
+        slots as polled and webhook-pushed issues, so an API call never
+        runs an agent on an issue the scheduler is already handling.
+        
+        Args:
+            kind: Trigger kind ("develop", "review" or "test")
+            issue_key: The Jira issue key
             
-            logger.info(f"  🔍 Reviewing {issue_key} with CodeReviewAgent...")
-            agent = CodeReviewAgent(repo_root=self.git_repo_path)
-            result = agent.execute({"code_changes": {}})
-            logger.info(f"  ✅ {issue_key} reviewed successfully: {result.decision}")
+        Returns:
+            False if the issue was skipped as a duplicate, True once the
+            agent has run (agent errors are logged, not raised)
+        """
+        return await self._dispatch(kind, issue_key)
+    
+    async def _dispatch(self, kind: str, issue_key: str) -> bool:
+        """Trigger ``kind`` on one issue while holding a slot and the workspace.
         
-        except Exception as e:
-            logger.error(f"  ❌ Error reviewing {issue_key}: {e}")
+        Duplicates are dropped before any waiting, so a skipped issue
+        never queues behind a running agent. The slot is taken first; the
+        workspace then goes to the highest-priority slot holder.
+        
+        Returns:
+            False if the issue was skipped, True once it has run
+        """
+        key = (kind, issue_key)
+        if not self._claim(key):
+            return False
+        
+        try:
+            async with self._slot(kind):
+                async with self._workspace.hold(self.PRIORITIES[kind]):
+                    await self._trigger(kind, issue_key)
+            return True
+        except asyncio.CancelledError:
+            # Cancelled before or while running; let the next tick retry it
+            self._recent.pop(key, None)
+            raise
+        finally:
+            self._in_flight.discard(key)
+    
+    def _claim(self, key: Tuple[str, str]) -> bool:
+        """Mark a (kind, issue_key) pair in flight unless it should be skipped.
+        
+        Returns:
+            False if the pair is already in flight (queued or running) or
+            was triggered within dedupe_ttl, True once it is marked
+        """
+        kind, issue_key = key
+        done = self.TRIGGERS[kind][3]
+        
+        # Never run the same stage twice at once, even past the TTL
+        if key in self._in_flight:
+            logger.info("  ⏭️  Skipping %s: still being %s", issue_key, done)
+            return False
+        
+        # Skip issues already triggered for this kind within the TTL; the
+        # mark is taken up front so overlapping poll/webhook runs dedupe too
+        now = time.monotonic()
+        if now - self._recent.get(key, -self.dedupe_ttl) < self.dedupe_ttl:
+            logger.info("  ⏭️  Skipping %s: %s recently", issue_key, done)
+            return False
+        self._recent[key] = now
+        self._in_flight.add(key)
+        return True
+    
+    def _slot(self, kind: str):
+        """Hold one of max_concurrency slots, granted in PRIORITIES order."""
+        return self._slots.hold(self.PRIORITIES[kind])
     
-    async def _trigger_testing_agent(self, issue_key: str):
-        """Trigger TestingAgent for an issue."""
+    async def _trigger(self, kind: str, issue_key: str):
+        """Run the agent registered for ``kind`` on a single claimed issue.
+        
+        Errors are logged rather than raised so one failing issue does not
+        abort the rest of the batch.
+        """
+        agent_name, icon, verb, done, runner = self.TRIGGERS[kind]
+        
         try:
-            from src.agents.testing_agent import TestingAgent
-            
-            logger.info(f"  🧪 Testing {issue_key} with TestingAgent...")
-            agent = TestingAgent(repo_root=self.git_repo_path)
-            result = agent.execute({"test_files": None, "test_path": "tests/"})
-            logger.info(f"  ✅ {issue_key} tested successfully: {result.status}")
+            logger.info("  %s %s %s with %s...", icon, verb, issue_key, agent_name)
+            outcome = await getattr(self, runner)(issue_key)
+            if outcome is None:
+                logger.info("  ✅ %s %s successfully", issue_key, done)
+            else:
+                logger.info("  ✅ %s %s successfully: %s", issue_key, done, outcome)
         
         except Exception as e:
-            logger.error(f"  ❌ Error testing {issue_key}: {e}")
+            # Let the next tick retry a failed issue
+            self._recent.pop((kind, issue_key), None)
+            logger.error("  ❌ Error %s %s: %s", verb.lower(), issue_key, e)
+    
+    def _prune_recent(self):
+        """Drop dedupe entries older than the TTL."""
+        cutoff = time.monotonic() - self.dedupe_ttl
+        self._recent = {key: ts for key, ts in self._recent.items() if ts > cutoff}
+    
+    async def _run_jira_agent(self, issue_key: str) -> None:
+        """Generate code, tests and a PR for an issue with JiraAgent."""
+        agent = await self._get_jira_agent()
+        await agent.process_task(issue_key)
+    
+    async def _run_code_review_agent(self, issue_key: str) -> str:
+        """Review an issue's changes and return the review decision."""
+        # execute() is blocking; keep it off the event loop
+        result = await asyncio.get_running_loop().run_in_executor(
+            self._get_io_pool(), self._get_code_review_agent().execute, {"code_changes": {}}
+        )
+        return result.decision.value
+    
+    async def _run_testing_agent(self, issue_key: str) -> str:
+        """Run the test suite for an issue and return the test status."""
+        # execute() shells out to pytest; keep it off the event loop.
+        # _dispatch holds the workspace, so one pytest at a time
+        result = await asyncio.get_running_loop().run_in_executor(
+            self._get_io_pool(),
+            self._get_testing_agent().execute,
+            {"test_files": None, "test_path": "tests/"},
+        )
+        return result.status.value
 
 # Global scheduler instance
 _scheduler_instance = None
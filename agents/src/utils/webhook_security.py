@@ -1,7 +1,7 @@
 import hmac
 import hashlib
 import json
-from typing import Tuple
+from typing import Tuple, Union
 
 
 class WebhookSecurity:
@@ -9,9 +9,9 @@ class WebhookSecurity:
     
     @staticmethod
     def verify_signature(
-        payload: str,
+        payload: Union[bytes, str],
         signature_header: str,
-        secret: str
+        secret: Union[bytes, str]
     ) -> bool:
         """
         Verify Jira webhook signature.
@@ -20,7 +20,8 @@ class WebhookSecurity:
         signature = HMAC-SHA256(payload, secret)
         
         Args:
-            payload: Raw request body (JSON string)
+            payload: Raw request body; pass the bytes from
+                ``await request.body()`` to avoid re-encoding it
             signature_header: Value of X-Atlassian-Webhook-Signature header
             secret: Webhook secret key
         
@@ -31,13 +32,6 @@ class WebhookSecurity:
             return False
         
         try:
-            # Compute expected signature
-            expected_signature = hmac.new(
-                secret.encode(),
-                payload.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
             # Signature header format: sha256=<hex>
             parts = signature_header.split("=", 1)
             if len(parts) != 2:
@@ -48,8 +42,15 @@ class WebhookSecurity:
             if algo != "sha256":
                 return False
             
-            # Compare signatures using constant-time comparison
-            return hmac.compare_digest(expected_signature, provided_signature)
+            # Compute expected signature over the raw bytes
+            if isinstance(secret, str):
+                secret = secret.encode()
+            if isinstance(payload, str):
+                payload = payload.encode()
+            expected_signature = hmac.new(secret, payload, hashlib.sha256).digest()
+            
+            # Compare raw digests using constant-time comparison
+            return hmac.compare_digest(expected_signature, bytes.fromhex(provided_signature))
         
         except Exception as e:
             print(f"Signature verification error: {e}")
@@ -69,7 +70,7 @@ class WebhookSecurity:
 #     body = await request.body()
 #     
 #     if not WebhookSecurity.verify_signature(
-#         body.decode(),
+#         body,
 #         x_atlassian_webhook_signature,
 #         os.getenv("JIRA_WEBHOOK_SECRET")
 #     ):
@@ -306,6 +306,13 @@ def test_proposal_serialization():
     parsed = json.loads(proposal_json)
     assert parsed["source_agent"] == "testing_agent"
     assert parsed["frequency"] == 3
+    assert parsed["pattern_type"] == "REPEATED_TEST_FAILURE"
+    assert parsed["suggested_domain"] == "TEST_PATTERNS"
+    assert parsed["gate_decision"] == proposal_dict["gate_decision"]
+    assert all(
+        type(proposal_dict[key]) is str
+        for key in ("pattern_type", "suggested_domain", "gate_decision")
+    ), "Enum fields should be plain strings"
     
     print(f"✓ Dict keys: {list(proposal_dict.keys())}")
     print(f"✓ JSON serializable: {len(proposal_json)} chars")
@@ -482,6 +489,110 @@ def test_different_patterns_tracked_separately():
     print("✅ Test passed: Different patterns tracked separately")
 
 
+def test_concurrent_pattern_detection():
+    """Test that concurrent trace analysis does not lose occurrences."""
+    
+    print("\n=== Test: Concurrent Pattern Detection ===")
+    
+    import threading
+    
+    detector = PatternDetector()
+    detector.clear()
+    
+    def analyze(worker: int):
+        for i in range(50):
+            trace = ExecutionTrace(
+                trace_id=f"test-{worker}-{i}",
+                trigger=TriggerInfo(source="test"),
+                intent_type="run_tests",
+                pipeline_status=PipelineStatus.PARTIAL,
+                started_at="2026-01-26T10:00:00",
+            )
+            step = trace.add_step(
+                agent_name="testing_agent",
+                agent_task="Run tests",
+                status=StepStatus.FAIL,
+            )
+            trace.update_step(
+                step.step_number,
+                StepStatus.FAIL,
+                success=False,
+                error_message="Test failed: test_checkout failed",
+            )
+            detector.analyze_trace(trace)
+    
+    threads = [threading.Thread(target=analyze, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    patterns = detector.get_all_patterns()
+    assert len(patterns) == 1
+    assert patterns[0].occurrences == 400
+    assert len(patterns[0].trace_ids) == 400
+    
+    print(f"✓ Occurrences: {patterns[0].occurrences}")
+    print("✅ Test passed: Concurrent detection is consistent")
+
+
+def test_bounded_stores():
+    """Test that pattern and proposal stores evict when full."""
+    
+    print("\n=== Test: Bounded Stores ===")
+    
+    detector = PatternDetector(max_patterns=2)
+    for i, error in enumerate(["error A", "error B", "error A", "error C"]):
+        trace = ExecutionTrace(
+            trace_id=f"test-{i}",
+            trigger=TriggerInfo(source="test"),
+            intent_type="run_tests",
+            pipeline_status=PipelineStatus.PARTIAL,
+            started_at="2026-01-26T10:00:00",
+        )
+        step = trace.add_step("testing_agent", "Run tests", StepStatus.FAIL)
+        trace.update_step(step.step_number, StepStatus.FAIL, success=False, error_message=error)
+        detector.analyze_trace(trace)
+    
+    # "error B" was least recently seen when "error C" arrived
+    signatures = {p.error_signature for p in detector.get_all_patterns()}
+    assert signatures == {"error A", "error C"}
+    
+    gate = LearningGate()
+    store = ProposalStore(max_proposals=2)
+    
+    def make_proposal(occurrences):
+        return gate.create_proposal(Pattern(
+            pattern_type=PatternType.REPEATED_TEST_FAILURE,
+            agent_name="testing_agent",
+            error_signature="Timeout error",
+            occurrences=occurrences,
+            first_seen="",
+            last_seen="",
+        ))
+    
+    approved = make_proposal(10)
+    rejected = make_proposal(1)
+    newest = make_proposal(10)
+    store.store(approved)
+    store.store(rejected)
+    store.store(newest)
+    
+    # Rejected proposals are evicted before approved ones
+    assert store.get(rejected.proposal_id) is None
+    assert store.get(approved.proposal_id) is not None
+    assert store.get(newest.proposal_id) is not None
+    
+    approved.created_at = "2020-01-01T00:00:00"
+    assert store.compact(window_seconds=3600) == 1
+    assert [p.proposal_id for p in store.get_all()] == [newest.proposal_id]
+    
+    print("✓ Patterns evicted in LRU order")
+    print("✓ Rejected proposals evicted first")
+    print("✓ compact() drops expired proposals")
+    print("✅ Test passed: Stores stay bounded")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("LEARNING GATE TEST SUITE")
@@ -497,6 +608,8 @@ if __name__ == "__main__":
     test_proposal_store()
     test_analyze_and_propose_integration()
     test_different_patterns_tracked_separately()
+    test_concurrent_pattern_detection()
+    test_bounded_stores()
     
     print("\n" + "="*60)
     print("✅ ALL LEARNING GATE TESTS PASSED")
@@ -8,7 +8,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 from orchestrator.orchestrator import Intent, Orchestrator
-from orchestrator.decision_router import list_available_intents
+from orchestrator.decision_router import (
+    get_intent_requirements,
+    list_available_intents,
+    list_intent_requirements,
+)
 
 
 def test_intent_creation():
@@ -31,6 +35,31 @@ def test_intent_creation():
     print("  ✓ Intent creation works")
 
 
+def test_intent_validation():
+    """Test the Intent validation contract."""
+    print("✓ Test: Intent validation")
+    
+    # Empty context is accepted; the orchestrator validates fields per intent
+    assert Intent(type="run_tests", context={}).context == {}
+    
+    # A non-dict context satisfies both TypeError and ValueError handlers
+    for expected in (TypeError, ValueError):
+        try:
+            Intent(type="run_tests", context=["ci"])
+        except expected:
+            pass
+        else:
+            raise AssertionError(f"non-dict context did not raise {expected.__name__}")
+    
+    try:
+        Intent(type="", context={})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("empty type was accepted")
+    print("  ✓ Empty context allowed; bad context and type rejected")
+
+
 def test_routing():
     """Test that routing works."""
     print("✓ Test: Intent routing")
@@ -72,6 +101,18 @@ def test_available_intents():
     
     assert set(intents) >= expected
     print(f"  ✓ Found {len(intents)} intents: {', '.join(sorted(intents))}")
+    
+    requirements = list_intent_requirements()
+    assert list(requirements) == intents
+    assert requirements["run_tests"] == get_intent_requirements("run_tests")
+    
+    # Orchestrator serves a cached copy that callers cannot corrupt
+    orchestrator = Orchestrator()
+    available = orchestrator.get_available_intents()
+    assert set(available) == set(intents)
+    available.clear()
+    assert orchestrator.get_available_intents()["run_tests"] == ["environment"]
+    print("  ✓ get_available_intents returns a fresh copy")
 
 
 def test_development_flow_routing():
@@ -103,6 +144,360 @@ def test_development_flow_routing():
     print(f"    Sequence: {' → '.join([t.agent for t in decision.execution_plan.tasks])}")
 
 
+def test_parallel_group_execution():
+    """Test that parallelizable groups run concurrently and keep plan order."""
+    print("✓ Test: Parallel group execution")
+    
+    import time
+    from orchestrator import decision_router
+    from orchestrator.decision_router import AgentTask, ExecutionPlan
+    
+    class SlowAgent:
+        def __init__(self, name):
+            self.name = name
+        
+        def execute(self, context):
+            time.sleep(0.3)
+            
+            class Output:
+                success = True
+            return Output()
+    
+    decision_router.DECISION_RULES["parallel_check"] = ExecutionPlan(
+        intent_type="parallel_check",
+        tasks=[
+            AgentTask(agent="slow_a", task="First", params={}),
+            AgentTask(agent="slow_b", task="Second", params={}),
+        ],
+        parallelizable=[{0, 1}],
+    )
+    try:
+        orchestrator = Orchestrator()
+        orchestrator._agent_instances["slow_a"] = SlowAgent("slow_a")
+        orchestrator._agent_instances["slow_b"] = SlowAgent("slow_b")
+        
+        started = time.perf_counter()
+        result = orchestrator.execute(Intent(type="parallel_check", context={}))
+        elapsed = time.perf_counter() - started
+    finally:
+        del decision_router.DECISION_RULES["parallel_check"]
+    
+    assert result.status == "success"
+    assert [r.agent for r in result.agent_results] == ["slow_a", "slow_b"]
+    assert elapsed < 0.55, f"Group ran sequentially ({elapsed:.2f}s)"
+    print(f"  ✓ Two 0.3s agents finished in {elapsed:.2f}s")
+
+
+def test_parallel_group_failure_settles_every_step():
+    """Test that a failing group member doesn't leave its siblings STARTED."""
+    print("✓ Test: Parallel group failure")
+    
+    from orchestrator import decision_router
+    from orchestrator.decision_router import AgentTask, ExecutionPlan
+    from orchestrator.execution_trace import StepStatus, get_trace_store
+    
+    class PassingAgent:
+        def execute(self, context):
+            class Output:
+                success = True
+            return Output()
+    
+    class CrashingAgent:
+        def execute(self, context):
+            raise RuntimeError("boom")
+    
+    decision_router.DECISION_RULES["parallel_failure"] = ExecutionPlan(
+        intent_type="parallel_failure",
+        tasks=[
+            AgentTask(agent="crash", task="First", params={}),
+            AgentTask(agent="pass", task="Second", params={}),
+            AgentTask(agent="never", task="Third", params={}),
+        ],
+        parallelizable=[{0, 1}],
+    )
+    try:
+        orchestrator = Orchestrator()
+        orchestrator._agent_instances["crash"] = CrashingAgent()
+        orchestrator._agent_instances["pass"] = PassingAgent()
+        result = orchestrator.execute(Intent(type="parallel_failure", context={}))
+    finally:
+        del decision_router.DECISION_RULES["parallel_failure"]
+    
+    assert result.status == "partial"
+    assert "boom" in result.error
+    assert [(r.agent, r.success) for r in result.agent_results] == [
+        ("crash", False), ("pass", True),
+    ]
+    assert result.agents_executed == 1
+    
+    trace = get_trace_store().get(result.trace_id)
+    assert [step.status for step in trace.steps] == [StepStatus.FAIL, StepStatus.SUCCESS]
+    print("  ✓ Both group members were recorded before the pipeline stopped")
+
+
+def test_sequential_execute_skips_event_loop():
+    """Test that plans without parallel groups run without asyncio."""
+    print("✓ Test: Sequential fast path")
+    
+    import asyncio
+    import threading
+    
+    seen = {}
+    
+    class RecordingAgent:
+        def execute(self, context):
+            seen["thread"] = threading.current_thread()
+            try:
+                asyncio.get_running_loop()
+                seen["loop"] = True
+            except RuntimeError:
+                seen["loop"] = False
+            
+            class Output:
+                success = True
+            return Output()
+    
+    orchestrator = Orchestrator()
+    orchestrator._agent_instances["testing_agent"] = RecordingAgent()
+    result = orchestrator.execute(Intent(type="run_tests", context={"environment": "ci"}))
+    
+    assert result.status == "success"
+    assert seen == {"thread": threading.current_thread(), "loop": False}
+    print("  ✓ Agent ran on the caller's thread with no event loop")
+
+
+def test_route_decision_cache():
+    """Test that routing decisions are cached per intent shape."""
+    print("✓ Test: Route decision cache")
+    
+    orchestrator = Orchestrator()
+    context = {
+        "event_code": "purchase",
+        "customer_id": "cust_123",
+        "transaction_id": "txn_001",
+        "merchant_id": "merch_001",
+        "amount": 99.99,
+    }
+    
+    first = orchestrator.route(Intent(type="register_event", context=dict(context)))
+    second = orchestrator.route(Intent(type="register_event", context={**context, "amount": 5}))
+    
+    assert first.status == second.status == "success"
+    assert first is not second
+    assert first.execution_plan is second.execution_plan
+    assert len(orchestrator._plan_cache) == 1
+    
+    # Mutating a returned decision must not leak into the cache
+    first.agents.append("rogue_agent")
+    third = orchestrator.route(Intent(type="register_event", context=dict(context)))
+    assert "rogue_agent" not in second.agents
+    assert "rogue_agent" not in third.agents
+    
+    # A different key set is routed (and validated) separately
+    missing = dict(context)
+    del missing["amount"]
+    failed = orchestrator.route(Intent(type="register_event", context=missing))
+    assert failed.status == "error"
+    assert "amount" in failed.error
+    print("  ✓ Same intent shape reuses the cached plan")
+    
+    stats = orchestrator.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 1)
+    orchestrator.invalidate_route_cache()
+    assert orchestrator.cache_stats()["size"] == 0
+    print("  ✓ Cache stats and invalidation work")
+
+
+def test_single_intent_definition():
+    """Test that orchestrator and router share one Intent class."""
+    print("✓ Test: Single Intent definition")
+    
+    from orchestrator import intent as intent_module
+    from orchestrator.router import DecisionRouter
+    
+    assert Intent is intent_module.Intent
+    
+    # An IntentType-typed intent routes through both entry points
+    intent = Intent(type=intent_module.IntentType.REVIEW_CODE, context={"repository": "repo"})
+    assert Orchestrator().route(intent).status == "success"
+    assert DecisionRouter().route(intent).agents_to_run == ("code_review_agent",)
+    print("  ✓ Intent is defined once")
+
+
+def test_agent_pool_checkout():
+    """Test that concurrent checkouts never share an agent instance."""
+    print("✓ Test: Agent pool checkout")
+    
+    orchestrator = Orchestrator()
+    
+    first = orchestrator._acquire_agent("testing_agent")
+    second = orchestrator._acquire_agent("testing_agent")
+    assert first is orchestrator._get_agent("testing_agent")
+    assert second is not first
+    
+    orchestrator._release_agent("testing_agent", second)
+    orchestrator._release_agent("testing_agent", first)
+    
+    # Released instances are reused instead of building new ones
+    assert orchestrator._acquire_agent("testing_agent") in (first, second)
+    print("  ✓ Busy agents are not handed out twice")
+    
+    # Releasing more instances than MAX_PER_AGENT keeps only the cap
+    orchestrator = Orchestrator()
+    busy = [
+        orchestrator._acquire_agent("testing_agent")
+        for _ in range(Orchestrator.MAX_PER_AGENT + 2)
+    ]
+    for agent in busy:
+        orchestrator._release_agent("testing_agent", agent)
+    assert len(orchestrator._idle_agents["testing_agent"]) == Orchestrator.MAX_PER_AGENT
+    
+    # A shared injected agent released twice is only pooled once
+    shared = object()
+    orchestrator._agent_instances["shared_agent"] = shared
+    orchestrator._release_agent("shared_agent", shared)
+    orchestrator._release_agent("shared_agent", shared)
+    assert orchestrator._idle_agents["shared_agent"] == [shared]
+    print("  ✓ Idle instances are capped and not duplicated")
+
+
+def test_execute_iter_streams_results():
+    """Test that execute_iter yields agent results and returns the pipeline result."""
+    print("✓ Test: Streaming execution")
+    
+    class PassingAgent:
+        def execute(self, context):
+            class Output:
+                success = True
+            return Output()
+    
+    orchestrator = Orchestrator()
+    orchestrator._agent_instances["testing_agent"] = PassingAgent()
+    
+    stream = orchestrator.execute_iter(Intent(type="run_tests", context={"environment": "ci"}))
+    streamed = []
+    while True:
+        try:
+            streamed.append(next(stream))
+        except StopIteration as stop:
+            result = stop.value
+            break
+    
+    assert [r.agent for r in streamed] == ["testing_agent"]
+    assert result.status == "success"
+    assert result.agent_results == streamed
+    print("  ✓ Yielded 1 agent result, returned PipelineResult")
+
+
+def test_agent_warmup():
+    """Test that warmup builds agents ahead of the first request."""
+    print("✓ Test: Agent warmup")
+    
+    orchestrator = Orchestrator()
+    orchestrator.warmup(["testing_agent", "no_such_agent"]).join(timeout=10)
+    
+    assert "testing_agent" in orchestrator._agent_instances
+    assert "no_such_agent" not in orchestrator._agent_instances
+    print("  ✓ Known agents built, unknown ones skipped")
+
+
+def test_execute_batch_preserves_order():
+    """Test that execute_batch returns one result per intent in input order."""
+    print("✓ Test: Batch execution")
+    
+    ran = []
+    
+    class PassingAgent:
+        def execute(self, context):
+            ran.append(context["environment"])
+            class Output:
+                success = True
+            return Output()
+    
+    orchestrator = Orchestrator()
+    orchestrator._agent_instances["testing_agent"] = PassingAgent()
+    
+    intents = [
+        Intent(type="run_tests", context={"environment": "ci"}),
+        Intent(type="unknown_intent", context={}),
+        Intent(type="run_tests", context={"environment": "staging"}),
+        Intent(type="run_tests", context={"environment": "prod"}),
+    ]
+    results = orchestrator.execute_batch(intents)
+    
+    assert [r.status for r in results] == ["success", "failure", "success", "success"]
+    assert [r.intent_type for r in results] == [i.type for i in intents]
+    assert ran == ["ci", "staging", "prod"]
+    print(f"  ✓ {len(results)} results returned and run in input order")
+    
+    # One routing call per intent shape, not per intent
+    stats = orchestrator.cache_stats()
+    assert (stats["hits"], stats["misses"]) == (0, 2)
+    print("  ✓ Each intent shape was routed once")
+
+
+def test_native_async_agent():
+    """Test that agents with an async aexecute are awaited directly."""
+    print("✓ Test: Native async agent")
+    
+    import asyncio
+    
+    class AsyncAgent:
+        def execute(self, context):
+            raise AssertionError("sync path should not be used")
+        
+        async def aexecute(self, context):
+            await asyncio.sleep(0)
+            
+            class Output:
+                success = True
+            return Output()
+    
+    orchestrator = Orchestrator()
+    orchestrator._agent_instances["testing_agent"] = AsyncAgent()
+    
+    result = asyncio.run(
+        orchestrator.aexecute(Intent(type="run_tests", context={"environment": "ci"}))
+    )
+    
+    assert result.status == "success", result.error
+    print("  ✓ aexecute() awaited on the event loop")
+
+
+def test_execute_rejects_non_intent():
+    """Test that execute() fails cleanly on input that is not an Intent."""
+    print("✓ Test: Execute rejects non-Intent input")
+    
+    result = Orchestrator().execute({"type": "run_tests"})
+    
+    assert result.status == "failure"
+    assert result.intent_type == "unknown"
+    assert "Intent" in result.error
+    print("  ✓ Non-Intent input returns a failure result")
+
+
+def test_decision_router_memoized():
+    """Test that DecisionRouter serves prebuilt decisions per intent type."""
+    print("✓ Test: DecisionRouter memoization")
+    
+    from orchestrator.router import DecisionRouter
+    
+    router = DecisionRouter()
+    first = router.route(Intent(type="run_tests", context={}))
+    second = router.route(Intent(type="run_tests", context={"environment": "ci"}))
+    
+    assert first is second
+    assert "testing_agent" in first.reasoning
+    
+    try:
+        router.route(Intent(type="no_such_intent", context={}))
+    except ValueError as e:
+        assert "no_such_intent" in str(e)
+    else:
+        raise AssertionError("Unknown intent should raise ValueError")
+    print("  ✓ Same intent type returns the same decision")
+
+
 def main():
     """Run all sanity checks."""
     print("\n" + "="*60)
@@ -111,9 +506,22 @@ def main():
     
     try:
         test_intent_creation()
+        test_intent_validation()
         test_routing()
         test_available_intents()
         test_development_flow_routing()
+        test_parallel_group_execution()
+        test_parallel_group_failure_settles_every_step()
+        test_sequential_execute_skips_event_loop()
+        test_route_decision_cache()
+        test_single_intent_definition()
+        test_agent_pool_checkout()
+        test_execute_iter_streams_results()
+        test_agent_warmup()
+        test_execute_batch_preserves_order()
+        test_native_async_agent()
+        test_execute_rejects_non_intent()
+        test_decision_router_memoized()
         
         print("\n" + "="*60)
         print("✓ ALL SANITY CHECKS PASSED")
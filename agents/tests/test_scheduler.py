@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Checks for AgentScheduler's concurrency slots, dedupe and webhook queue."""
+
+import asyncio
+import sys
+import os
+
+# The scheduler imports its agents as src.*; append so src/ (inserted by
+# the other test modules) keeps resolving the top-level `agents` package
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.scheduler.scheduler import AgentScheduler, _PriorityGate
+
+
+class FakeScheduler(AgentScheduler):
+    """Scheduler whose agent runners record calls instead of running agents."""
+    
+    def __init__(self, max_concurrency: int = 8):
+        super().__init__()
+        self.max_concurrency = max_concurrency
+        self._slots = _PriorityGate(max_concurrency)
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+        self.peak_slots = 0
+        # Set to hold runners until the test lets them finish
+        self.release = None
+    
+    async def _run(self, issue_key: str):
+        self.calls.append(issue_key)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.peak_slots = max(self.peak_slots, self.max_concurrency - self._slots.free)
+        try:
+            if self.release is not None:
+                await self.release.wait()
+            else:
+                await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+    
+    _run_jira_agent = _run_code_review_agent = _run_testing_agent = _run
+
+
+def test_concurrency_cap_never_exceeded():
+    """Test the slot cap and that only one agent uses the workspace at once."""
+    print("✓ Test: Concurrency cap")
+    
+    async def scenario():
+        scheduler = FakeScheduler(max_concurrency=2)
+        await asyncio.gather(
+            scheduler._fan_out([f"R-{i}" for i in range(6)], "review"),
+            scheduler._fan_out([f"D-{i}" for i in range(3)], "develop"),
+        )
+        return scheduler
+    
+    scheduler = asyncio.run(scenario())
+    
+    assert len(scheduler.calls) == 9
+    assert scheduler.peak_slots == 2
+    assert scheduler.peak == 1
+    assert scheduler._slots.free == 2 and not scheduler._slots.waiters
+    assert scheduler._workspace.free == 1
+    print("  ✓ 9 issues held at most 2 slots and ran one at a time")
+
+
+def test_freed_slot_goes_to_highest_priority():
+    """Test that a freed slot goes to the lowest PRIORITIES value first."""
+    print("✓ Test: Slot priority")
+    
+    async def scenario():
+        scheduler = FakeScheduler(max_concurrency=1)
+        holder = scheduler._slot("review")
+        await holder.__aenter__()
+        
+        # Queued lowest priority first; each waits for the held slot
+        waiters = [
+            asyncio.create_task(scheduler._dispatch(kind, issue_key))
+            for kind, issue_key in (("test", "T-1"), ("review", "R-1"), ("develop", "D-1"))
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.calls == []
+        
+        await holder.__aexit__(None, None, None)
+        await asyncio.gather(*waiters)
+        return scheduler
+    
+    scheduler = asyncio.run(scenario())
+    
+    assert scheduler.calls == ["D-1", "R-1", "T-1"]
+    assert scheduler._slots.free == 1
+    print("  ✓ develop ran before review, review before test")
+
+
+def test_cancelled_waiter_passes_slot_on():
+    """Test that a waiter cancelled after being handed a slot passes it on."""
+    print("✓ Test: Slot hand-off on cancellation")
+    
+    async def scenario():
+        scheduler = FakeScheduler(max_concurrency=1)
+        acquired = []
+        
+        async def wait(kind: str, name: str):
+            async with scheduler._slot(kind):
+                acquired.append(name)
+        
+        holder = scheduler._slot("review")
+        await holder.__aenter__()
+        first = asyncio.create_task(wait("develop", "first"))
+        second = asyncio.create_task(wait("test", "second"))
+        await asyncio.sleep(0)
+        
+        # Releasing hands the slot to `first` before it gets to run
+        await holder.__aexit__(None, None, None)
+        assert len(scheduler._slots.waiters) == 1
+        first.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+        return scheduler, first, acquired
+    
+    scheduler, first, acquired = asyncio.run(scenario())
+    
+    assert first.cancelled()
+    assert acquired == ["second"]
+    assert scheduler._slots.free == 1 and not scheduler._slots.waiters
+    print("  ✓ The slot reached the next waiter and was not leaked")
+
+
+def test_duplicate_and_in_flight_triggers_skipped():
+    """Test that in-flight and recently triggered issues are skipped."""
+    print("✓ Test: Trigger dedupe")
+    
+    async def scenario():
+        scheduler = FakeScheduler()
+        scheduler.release = asyncio.Event()
+        
+        # Still running: skipped even with the TTL disabled
+        scheduler.dedupe_ttl = 0
+        running = asyncio.create_task(scheduler.run_now("test", "T-1"))
+        await asyncio.sleep(0)
+        assert await scheduler.run_now("test", "T-1") is False
+        scheduler.release.set()
+        assert await running is True
+        assert scheduler._in_flight == set()
+        
+        # Finished within the TTL: skipped; another kind still runs
+        scheduler.dedupe_ttl = 300
+        assert await scheduler.run_now("review", "R-1") is True
+        assert await scheduler.run_now("review", "R-1") is False
+        assert await scheduler.run_now("test", "R-1") is True
+        return scheduler
+    
+    scheduler = asyncio.run(scenario())
+    
+    assert scheduler.calls == ["T-1", "R-1", "R-1"]
+    print("  ✓ Duplicates were skipped without running the agent")
+
+
+def test_workspace_goes_to_highest_priority():
+    """Test that the shared checkout is handed over in PRIORITIES order."""
+    print("✓ Test: Workspace priority")
+    
+    async def scenario():
+        scheduler = FakeScheduler()
+        scheduler.release = asyncio.Event()
+        running = asyncio.create_task(scheduler._dispatch("test", "T-1"))
+        await asyncio.sleep(0)
+        
+        # Both hold slots but wait for the checkout T-1 is using
+        waiters = [
+            asyncio.create_task(scheduler._dispatch(kind, issue_key))
+            for kind, issue_key in (("review", "R-1"), ("develop", "D-1"))
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.calls == ["T-1"]
+        
+        scheduler.release.set()
+        await asyncio.gather(running, *waiters)
+        return scheduler
+    
+    scheduler = asyncio.run(scenario())
+    
+    assert scheduler.calls == ["T-1", "D-1", "R-1"]
+    assert scheduler.peak == 1
+    print("  ✓ develop got the checkout before the earlier review")
+
+
+def test_webhook_queue_drains_by_priority():
+    """Test that queued webhook pushes run development work first."""
+    print("✓ Test: Webhook queue priority")
+    
+    async def scenario():
+        scheduler = FakeScheduler()
+        assert scheduler.enqueue("T-1", "Testing") == "test"
+        assert scheduler.enqueue("R-1", "In Review") == "review"
+        assert scheduler.enqueue("D-1", "Waiting Development") == "develop"
+        assert scheduler.enqueue("X-1", "Done") is None
+        await scheduler._queue.join()
+        scheduler.stop()
+        return scheduler
+    
+    scheduler = asyncio.run(scenario())
+    
+    assert scheduler.calls == ["D-1", "R-1", "T-1"]
+    print("  ✓ Queued issues ran in priority order")
+
+
+def test_long_queued_run_does_not_hold_up_the_queue():
+    """Test that a long queued run doesn't delay develop work queued after it."""
+    print("✓ Test: Webhook queue head-of-line")
+    
+    async def scenario():
+        scheduler = FakeScheduler()
+        scheduler.release = asyncio.Event()
+        scheduler.enqueue("T-1", "Testing")
+        await asyncio.sleep(0.01)
+        assert scheduler.calls == ["T-1"]
+        
+        # Pushed while T-1 is still running: both are taken off the queue
+        # at once and wait only for the checkout, not for the consumer
+        scheduler.enqueue("R-1", "In Review")
+        scheduler.enqueue("D-1", "Waiting Development")
+        await asyncio.sleep(0.01)
+        assert scheduler._queue.qsize() == 0
+        assert {("review", "R-1"), ("develop", "D-1")} <= scheduler._in_flight
+        
+        # A repeat push for the running issue is dropped straight away
+        scheduler.enqueue("T-1", "Testing")
+        await asyncio.sleep(0.01)
+        assert scheduler._queue.qsize() == 0 and len(scheduler._dispatches) == 3
+        
+        scheduler.release.set()
+        await scheduler._queue.join()
+        scheduler.stop()
+        return scheduler
+    
+    scheduler = asyncio.run(scenario())
+    
+    assert scheduler.calls == ["T-1", "D-1", "R-1"]
+    print("  ✓ Later develop work was picked up while the test run was going")
+
+
+def test_io_pool_recreated_after_stop():
+    """Test that blocking work still runs after stop() and a restart."""
+    print("✓ Test: IO pool lifecycle")
+    
+    async def scenario():
+        scheduler = FakeScheduler()
+        scheduler.start()
+        first = scheduler._get_io_pool()
+        scheduler.stop()
+        
+        scheduler.start()
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(scheduler._get_io_pool(), sum, [1, 2])
+        scheduler.stop()
+        return first, result
+    
+    first, result = asyncio.run(scenario())
+    
+    assert result == 3
+    assert first._shutdown
+    print("  ✓ A restarted scheduler got a fresh thread pool")
+
+
+def main():
+    """Run all scheduler checks."""
+    print("\n" + "="*60)
+    print("SCHEDULER CHECKS")
+    print("="*60 + "\n")
+    
+    try:
+        test_concurrency_cap_never_exceeded()
+        test_freed_slot_goes_to_highest_priority()
+        test_cancelled_waiter_passes_slot_on()
+        test_workspace_goes_to_highest_priority()
+        test_duplicate_and_in_flight_triggers_skipped()
+        test_webhook_queue_drains_by_priority()
+        test_long_queued_run_does_not_hold_up_the_queue()
+        test_io_pool_recreated_after_stop()
+        
+        print("\n" + "="*60)
+        print("✓ ALL SCHEDULER CHECKS PASSED")
+        print("="*60 + "\n")
+        return 0
+        
+    except Exception as e:
+        print("\n" + "="*60)
+        print(f"✗ SCHEDULER CHECK FAILED: {e}")
+        print("="*60 + "\n")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
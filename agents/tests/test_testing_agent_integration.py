@@ -39,7 +39,7 @@ def test_testing_agent_pass_continues_pipeline():
     
     # Check that PASS status is allowed to continue
     mock_output = MockPassingTestAgent().execute({})
-    should_continue, error = orchestrator._check_agent_result("testing_agent", mock_output)
+    should_continue, error, _ = orchestrator._check_agent_result("testing_agent", mock_output)
     
     assert should_continue == True, "PASS status should allow pipeline to continue"
     assert error is None, "PASS status should not have error message"
@@ -80,7 +80,7 @@ def test_testing_agent_fail_stops_pipeline():
     
     # Check that FAIL status stops pipeline
     mock_output = MockFailingTestAgent().execute({})
-    should_continue, error = orchestrator._check_agent_result("testing_agent", mock_output)
+    should_continue, error, _ = orchestrator._check_agent_result("testing_agent", mock_output)
     
     assert should_continue == False, "FAIL status should stop pipeline"
     assert error is not None, "FAIL status should have error message"